@@ -1,17 +1,57 @@
 import json
+import logging
+import random
+import socket
 import ssl
+import sys
 import websockets
 import asyncio
 import threading
-from typing import Dict, Callable, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Callable, Optional, Tuple
 from logger import Logger
 from auth import LeagueClientAuth
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+
+# Use orjson for the WebSocket hot path when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Prefer a libuv-backed event loop for the WebSocket client when one is installed
+try:
+    import uvloop
+    _loop_policy = uvloop.EventLoopPolicy()
+except ImportError:
+    try:
+        import winloop
+        _loop_policy = winloop.EventLoopPolicy()
+    except ImportError:
+        _loop_policy = None
 
 # Disable SSL warnings for local connections
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# The LCU serves a self-signed certificate on localhost; build the context once
+_LCU_SSL_CONTEXT = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+_LCU_SSL_CONTEXT.check_hostname = False
+_LCU_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+# Prefix the LCU adds to every JSON API event name
+_EVENT_PREFIX = "OnJsonApiEvent_"
+
+# Reconnect backoff bounds in seconds; the delay doubles per failed attempt
+_RECONNECT_MIN_DELAY = 0.1
+_RECONNECT_MAX_DELAY = 30.0
+
 class LCUApi:
     """
     League Client Update (LCU) API client that handles WebSocket connections and events.
@@ -35,12 +75,40 @@ class LCUApi:
         self.logger = Logger()
         self._ws_thread: Optional[threading.Thread] = None
         self._running = False
-        self._event_handlers: Dict[str, List[Callable]] = {}  # Changed to support multiple callbacks
+        self._event_handlers: Dict[str, Dict[Callable, None]] = {}  # Insertion-ordered set of callbacks per path
+        self._dispatch_cache: Dict[str, Tuple[Tuple[Callable, bool], ...]] = {}  # Event path -> (callback, is_coroutine)
+        self._subscribe_frames: Dict[str, str] = {}  # Event path -> serialized subscribe message
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None  # Connect/reconnect task on self._loop
+        self._client_ready: Optional[asyncio.Event] = None  # Set by auth when the client comes up
         self._subscribed = False
+        self._subscribe_task: Optional[asyncio.Task] = None
         self._connection_callback: Optional[Callable] = None
         self.is_connected = False  # Add connection state tracking
+        self._executor: Optional[ThreadPoolExecutor] = None  # Runs sync event handlers off the loop
+        self._debug = self.logger.logger.isEnabledFor(logging.DEBUG)  # Refreshed on each connection
+
+        # Persistent REST session so LCU requests reuse the same TLS connection
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        self._session.verify = False
+        self.auth.add_connection_callback(self._update_session_headers)
+        self.auth.add_connection_callback(self._on_client_state)
+
+    def _update_session_headers(self, connected: bool):
+        """Refresh the REST session headers when the League Client auth state changes."""
+        self._session.headers.pop("Authorization", None)
+        if connected:
+            self._session.headers.update(self.auth.get_connection_headers())
+
+    def _on_client_state(self, connected: bool):
+        """Wake the connect task when the auth monitor sees the League Client start."""
+        if connected and self._client_ready and self._loop and not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(self._client_ready.set)
+            except RuntimeError:
+                pass  # Loop closed while we were checking
 
     def set_connection_callback(self, callback: Callable):
         """
@@ -65,6 +133,7 @@ class LCUApi:
             return
 
         self._running = True
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lcu-events")
         self._ws_thread = threading.Thread(target=self._run_websocket_client)
         self._ws_thread.daemon = True
         self._ws_thread.start()
@@ -76,15 +145,23 @@ class LCUApi:
         
         This method will:
         1. Set the running flag to False
-        2. Wait for the WebSocket thread to finish (with a 5-second timeout)
-        3. Stop the event loop if it exists
+        2. Cancel the client task on its event loop
+        3. Wait for the WebSocket thread to finish (with a 5-second timeout)
         """
         self.logger.info("Stopping WebSocket client...")
         self._running = False
+        if self._task and self._loop and not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+            except RuntimeError:
+                pass  # Loop closed while we were checking
         if self._ws_thread and self._ws_thread.is_alive():
             self._ws_thread.join(timeout=5)
-        if self._loop:
-            self._loop.stop()
+        self._task = None
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._session.close()
         self.logger.info("WebSocket client stopped")
 
     # Event Subscription
@@ -97,14 +174,12 @@ class LCUApi:
             callback (Callable): The function to call when the event occurs
         """
         self._store_subscription(event_path, callback)
-        self.logger.debug(f"Added callback for event: {event_path}")
+        if self._debug:
+            self.logger.debug("Added callback for event: %s", event_path)
         
         # If we're already connected but not subscribed, try to subscribe
         if self.is_connected and not self._subscribed and self._ws:
-            asyncio.run_coroutine_threadsafe(
-                self._subscribe_to_events(), 
-                self._loop
-            )
+            self._schedule_subscribe()
 
     def unsubscribe(self, event_path: str, callback: Callable = None):
         """
@@ -120,32 +195,77 @@ class LCUApi:
                 self._event_handlers[event_path].clear()
                 self.logger.debug(f"Removed all callbacks for event: {event_path}")
             else:
-                self._event_handlers[event_path].remove(callback)
+                self._event_handlers[event_path].pop(callback, None)
                 self.logger.debug(f"Removed specific callback for event: {event_path}")
+            self._dispatch_cache = {}
+
+    def _schedule_subscribe(self):
+        """Schedule event subscription on the WebSocket loop without waiting for it."""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            self._create_subscribe_task()
+        else:
+            self._loop.call_soon_threadsafe(self._create_subscribe_task)
+
+    def _create_subscribe_task(self):
+        """Create the subscription task, keeping a reference so it isn't garbage collected."""
+        self._subscribe_task = self._loop.create_task(self._subscribe_to_events())
 
     def _store_subscription(self, event_path: str, callback: Callable):
         """Helper method to store event subscriptions."""
         if event_path not in self._event_handlers:
-            self._event_handlers[event_path] = []
-        if callback not in self._event_handlers[event_path]:
-            self._event_handlers[event_path].append(callback)
+            self._subscribe_frames[event_path] = _json_dumps([5, _EVENT_PREFIX + event_path, {}])
+        handlers = self._event_handlers.setdefault(event_path, {})
+        if callback not in handlers:
+            handlers[callback] = None
+            self._dispatch_cache = {}
+
+    def _resolve_handlers(self, event_path: str) -> Tuple[Tuple[Callable, bool], ...]:
+        """
+        Get every callback registered for an event path, including prefix subscriptions.
+
+        The result is cached per event path until the subscriptions change, so the
+        prefix scan only runs the first time a path is seen. A callback registered
+        under several matching prefixes is only called once. Each callback is paired
+        with whether it is a coroutine function, so dispatch doesn't re-inspect it.
+        """
+        cache = self._dispatch_cache
+        handlers = cache.get(event_path)
+        if handlers is None:
+            callbacks = dict.fromkeys(
+                callback
+                for registered_path, registered in list(self._event_handlers.items())
+                if event_path.startswith(registered_path)
+                for callback in registered
+            )
+            handlers = tuple(
+                (callback, asyncio.iscoroutinefunction(callback)) for callback in callbacks
+            )
+            cache[event_path] = handlers
+        return handlers
 
     # WebSocket Connection Handling
     async def _subscribe_to_events(self):
         """Subscribe to specific events based on registered event handlers."""
         if not self._subscribed and self._ws:
             try:
-                # Get list of unique event paths
-                event_paths = list(self._event_handlers.keys())
-                if not event_paths:
+                # Subscribe messages are serialized once, when the event is registered
+                frames = dict(self._subscribe_frames)
+                if not frames:
                     self.logger.debug("No events to subscribe to")
                     return
 
-                # Subscribe to each event individually
-                for event_path in event_paths:
-                    subscribe_msg = [5, "OnJsonApiEvent_" + event_path, {}]
-                    await self._ws.send(json.dumps(subscribe_msg))
-                    self.logger.debug(f"Subscribed to event: {event_path}")
+                # The LCU WAMP endpoint expects one message per subscription,
+                # so queue the writes back-to-back
+                event_paths = list(frames.keys())
+                messages = list(frames.values())
+                await asyncio.gather(*(self._ws.send(message) for message in messages))
+                if self._debug:
+                    self.logger.debug("Subscribed to events: %s", ', '.join(event_paths))
 
                 self._subscribed = True
                 self.logger.info(f"Subscribed to {len(event_paths)} LCU events")
@@ -159,14 +279,13 @@ class LCUApi:
         """
         Establish WebSocket connection to LCU.
         """
-        # Wait for client to be running
+        # Wait for the auth monitor to report the client instead of polling for it
         while not self.auth.is_client_running:
             self.logger.debug("Waiting for League Client to start...")
-            await asyncio.sleep(1)
-
-        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+            self._client_ready.clear()
+            if self.auth.is_client_running:
+                break
+            await self._client_ready.wait()
 
         uri = f"wss://127.0.0.1:{self.auth.client_port}"
         conn_headers = self.auth.get_connection_headers()
@@ -179,9 +298,18 @@ class LCUApi:
         try:
             self._ws = await websockets.connect(
                 uri,
-                ssl=ssl_context,
-                additional_headers=headers
+                ssl=_LCU_SSL_CONTEXT,
+                additional_headers=headers,
+                # Loopback connection: skip permessage-deflate and keepalive pings
+                compression=None,
+                ping_interval=None
             )
+
+            # Subscribe frames and acks are tiny; don't let Nagle hold them back
+            sock = self._ws.transport.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
             self.logger.info("Connected to LCU WebSocket")
             
             # Update connection state first
@@ -217,31 +345,34 @@ class LCUApi:
         This method:
         1. Receives messages from the WebSocket connection
         2. Parses JSON data
-        3. Dispatches events to registered callbacks
+        3. Queues events for the dispatcher, which calls registered callbacks
         
         The method runs in a loop until the connection is closed or an error occurs.
         """
+        events: asyncio.Queue = asyncio.Queue()
+        dispatcher = self._loop.create_task(self._dispatch_events(events))
+        self._debug = self.logger.logger.isEnabledFor(logging.DEBUG)
+
+        # Bind hot-loop lookups to locals once per connection
+        ws = self._ws
+        recv = ws.recv
+        loads = _json_loads
+        enqueue = events.put_nowait
+        prefix = _EVENT_PREFIX
+        prefix_len = len(_EVENT_PREFIX)
         try:
-            while self._running and self._ws:
-                message = await self._ws.recv()
+            while self._running and self._ws is ws:
+                # Raw bytes; both orjson and json parse UTF-8 directly
+                message = await recv(decode=False)
                 try:
-                    data = json.loads(message)
+                    data = loads(message)
                     if len(data) == 3 and data[0] == 8:  # Event message format
-                        event_path = data[1].replace("OnJsonApiEvent_", "")
-                        event_data = data[2]
-                        event_uri = event_data.get("uri", "")
-                        
-                        #self.logger.debug(f"Received event: {event_path}")
-                        
-                        # Check if any callbacks are registered for this event
-                        for registered_path, callbacks in self._event_handlers.items():
-                            if event_path.startswith(registered_path):
-                                for callback in callbacks:
-                                    try:
-                                        self.logger.debug(f"Calling event handler for {event_path}")
-                                        callback(event_data)
-                                    except Exception as e:
-                                        self.logger.error(f"Error in event handler for {event_path}: {str(e)}")
+                        event_name = data[1]
+                        if event_name.startswith(prefix):
+                            event_path = event_name[prefix_len:]
+                        else:
+                            event_path = event_name
+                        enqueue((event_path, data[2]))
                                         
                 except json.JSONDecodeError:
                     self.logger.warning(f"Received invalid JSON message: {message}")
@@ -250,35 +381,122 @@ class LCUApi:
             self.logger.warning("WebSocket connection closed")
         except Exception as e:
             self.logger.error(f"Error handling WebSocket messages: {str(e)}")
+        finally:
+            dispatcher.cancel()
+
+    async def _dispatch_events(self, events: asyncio.Queue):
+        """
+        Dispatch queued events to their callbacks in batches.
+
+        Everything that arrived since the last batch is drained at once, and only
+        the latest update for each event path and URI is dispatched, so bursts
+        (e.g. during champion select) don't replay stale session states.
+        """
+        get = events.get
+        get_nowait = events.get_nowait
+        empty = events.empty
+        dispatch = self._dispatch_event
+        while True:
+            event_path, event_data = await get()
+            pending = {(event_path, event_data.get("uri", "")): (event_path, event_data)}
+
+            while not empty():
+                event_path, event_data = get_nowait()
+                key = (event_path, event_data.get("uri", ""))
+                # Re-insert so the batch keeps the order of the latest updates
+                pending.pop(key, None)
+                pending[key] = (event_path, event_data)
+
+            for event_path, event_data in pending.values():
+                dispatch(event_path, event_data)
+
+    def _dispatch_event(self, event_path: str, event_data: Dict):
+        """
+        Hand an event to every registered callback without blocking the receive loop.
+
+        Coroutine callbacks run as tasks on the WebSocket loop; regular callbacks
+        run on the handler executor.
+        """
+        for callback, is_coroutine in self._resolve_handlers(event_path):
+            if is_coroutine:
+                self._loop.create_task(self._run_async_handler(callback, event_path, event_data))
+            else:
+                self._loop.run_in_executor(
+                    self._executor, self._run_handler, callback, event_path, event_data
+                )
+
+    def _run_handler(self, callback: Callable, event_path: str, event_data: Dict):
+        """Run a synchronous event handler, logging any error it raises."""
+        try:
+            if self._debug:
+                self.logger.debug("Calling event handler for %s", event_path)
+            callback(event_data)
+        except Exception as e:
+            self.logger.error(f"Error in event handler for {event_path}: {str(e)}")
+
+    async def _run_async_handler(self, callback: Callable, event_path: str, event_data: Dict):
+        """Run a coroutine event handler, logging any error it raises."""
+        try:
+            if self._debug:
+                self.logger.debug("Calling event handler for %s", event_path)
+            await callback(event_data)
+        except Exception as e:
+            self.logger.error(f"Error in event handler for {event_path}: {str(e)}")
 
     def _run_websocket_client(self):
         """
-        Main WebSocket client loop running in separate thread.
-        
-        This method:
-        1. Creates and sets up the event loop
-        2. Handles connection and reconnection logic
-        3. Manages the WebSocket lifecycle
+        Host the LCU event loop in its own thread.
         
-        If connection fails, it will attempt to reconnect every 5 seconds.
+        Tkinter owns the main thread, so the WebSocket client keeps a dedicated
+        thread, but everything inside it runs on one long-lived loop as a single
+        task that stop() can cancel.
         """
-        self._loop = asyncio.new_event_loop()
+        if _loop_policy:
+            self._loop = _loop_policy.new_event_loop()
+        else:
+            self._loop = asyncio.new_event_loop()
+        if sys.version_info >= (3, 12):
+            # Run tasks that finish without suspending synchronously on creation
+            self._loop.set_task_factory(asyncio.eager_task_factory)
         asyncio.set_event_loop(self._loop)
+        self._client_ready = asyncio.Event()
+
+        self._task = self._loop.create_task(self._run())
+        try:
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop.close()
 
+        self.logger.debug("WebSocket client thread ending")
+
+    async def _run(self):
+        """
+        Connect to the LCU and handle messages until stopped.
+        
+        Reconnects use exponential backoff with jitter, starting at 100ms and
+        capped at 30 seconds; the delay resets after every successful connection.
+        """
+        delay = _RECONNECT_MIN_DELAY
         while self._running:
             try:
-                self._loop.run_until_complete(self._connect())
-                self._loop.run_until_complete(self._handle_messages())
+                await self._connect()
+                delay = _RECONNECT_MIN_DELAY
+                await self._handle_messages()
             except Exception as e:
                 self.logger.error(f"WebSocket error: {str(e)}")
                 if self._running:
-                    self.logger.info("Attempting to reconnect in 5 seconds...")
-                    asyncio.run(asyncio.sleep(5))
+                    self.logger.info(f"Attempting to reconnect in {delay:.1f} seconds...")
             finally:
                 if self._ws:
-                    self._loop.run_until_complete(self._ws.close())
+                    await self._ws.close()
+                    self._ws = None
+                self.is_connected = False
 
-        self.logger.debug("WebSocket client thread ending")
+            if self._running:
+                await asyncio.sleep(delay + random.random() * 0.3 * delay)
+                delay = min(delay * 2, _RECONNECT_MAX_DELAY)
 
     def get_request(self, endpoint: str) -> Dict:
         """
@@ -298,14 +516,9 @@ class LCUApi:
             return {}
             
         url = f"https://127.0.0.1:{self.auth.client_port}/{endpoint}"
-        headers = self.auth.get_connection_headers()
         
         try:
-            response = requests.get(
-                url, 
-                headers=headers,
-                verify=False
-            )
+            response = self._session.get(url)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -331,15 +544,9 @@ class LCUApi:
             return {}
 
         url = f"https://127.0.0.1:{self.auth.client_port}/{endpoint}"
-        headers = self.auth.get_connection_headers()
         
         try:
-            response = requests.post(
-                url,
-                headers=headers,
-                json=data,
-                verify=False
-            )
+            response = self._session.post(url, json=data)
             response.raise_for_status()
             return response.json() if response.content else {}
         except requests.RequestException as e:
@@ -1,61 +1,63 @@
-import asyncio
 import base64
+import logging
 import json
 import os
 import psutil
 import re
-from typing import Optional, Tuple, Callable
-from threading import Thread
+from typing import Optional, Tuple, Callable, List
+from threading import Thread, Event
 from logger import Logger
 
-import time
+_AUTH_TOKEN_PREFIX = '--remoting-auth-token='
+_APP_PORT_PREFIX = '--app-port='
+
+# Fallbacks for command lines that arrive as a single shell-quoted argument
+_AUTH_TOKEN_RE = re.compile(r'--remoting-auth-token="?([^"\s]+)')
+_APP_PORT_RE = re.compile(r'--app-port="?([^"\s]+)')
 
 class LeagueClientAuth:
     """Handles League Client authentication and connection state."""
     
     def __init__(self):
-        self.auth_token: Optional[str] = None
+        self._cached_headers: dict = {}
+        self.auth_token = None
         self.client_port: Optional[int] = None
         self.process_names = ["LeagueClientUx.exe", "LeagueClient.exe"]  # Support both process names
         self._monitoring = False
         self._monitor_thread: Optional[Thread] = None
         self.logger = Logger()
-        self._delay = 0.1
+        self._stop_event = Event()
         self._connection_callbacks = []
         self._connected = False
+        self._last_pid: Optional[int] = None
+        self._debug = self.logger.logger.isEnabledFor(logging.DEBUG)
         
-    async def get_auth_data(self) -> Tuple[Optional[str], Optional[int]]:
+    def get_auth_data(self) -> Tuple[Optional[str], Optional[int]]:
         """Get authentication data from the League Client process."""
-        for process in psutil.process_iter(['name', 'cmdline']):
+        # Try the last known League Client process before scanning every process
+        if self._last_pid is not None:
             try:
-                if process.info['name'] in self.process_names:
-                    cmdline = process.info['cmdline']
-                    if not cmdline:
-                        continue
-                        
-                    # Debug logging
-                    self.logger.debug(f"Found process: {process.info['name']}")
-                    #self.logger.debug(f"Command line: {' '.join(cmdline)}")
-                    
-                    # More flexible regex patterns
-                    cmd_str = ' '.join(cmdline)
-                    auth_token = (
-                        re.findall(r'--remoting-auth-token=([^"\s]+)', cmd_str) or
-                        re.findall(r'--remoting-auth-token="([^"]+)"', cmd_str)
-                    )
-                    port = (
-                        re.findall(r'--app-port=([^"\s]+)', cmd_str) or
-                        re.findall(r'--app-port="([^"]+)"', cmd_str)
-                    )
-                    
-                    if auth_token and port:
-                        self.logger.debug(f"Found League Client process {process.info['name']} on port {port[0]}")
-                        return (
-                            base64.b64encode(f"riot:{auth_token[0]}".encode()).decode(),
-                            int(port[0])
-                        )
-                    else:
-                        self.logger.debug("Auth token or port not found in command line")
+                process = psutil.Process(self._last_pid)
+                name = process.name()
+                if name in self.process_names:
+                    auth_data = self._read_process_auth(process, name)
+                    if auth_data:
+                        return auth_data
+            except (psutil.Error, ValueError):
+                pass
+            self._last_pid = None
+
+        # Only request the name up front; cmdline is read for matching processes only
+        for process in psutil.process_iter(['name']):
+            name = process.info['name']
+            if name not in self.process_names:
+                continue
+
+            try:
+                auth_data = self._read_process_auth(process, name)
+                if auth_data:
+                    self._last_pid = process.pid
+                    return auth_data
                         
             except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
                 self.logger.error(f"Error accessing process: {str(e)}")
@@ -67,10 +69,56 @@ class LeagueClientAuth:
         self.logger.warning("League Client process not found")
         return None, None
 
-    async def update_auth(self):
+    def _read_process_auth(self, process: psutil.Process, name: str) -> Optional[Tuple[str, int]]:
+        """Read authentication data from a single League Client process."""
+        cmdline = process.cmdline()
+        if not cmdline:
+            return None
+
+        # Debug logging
+        if self._debug:
+            self.logger.debug("Found process: %s", name)
+
+        auth_token, port = self._parse_cmdline(cmdline)
+        if auth_token and port:
+            if self._debug:
+                self.logger.debug("Found League Client process %s on port %s", name, port)
+            return (
+                base64.b64encode(f"riot:{auth_token}".encode()).decode(),
+                int(port)
+            )
+
+        self.logger.debug("Auth token or port not found in command line")
+        return None
+
+    @staticmethod
+    def _parse_cmdline(cmdline: List[str]) -> Tuple[Optional[str], Optional[str]]:
+        """Extract the auth token and app port from a League Client command line."""
+        auth_token = None
+        port = None
+        for arg in cmdline:
+            if arg.startswith(_AUTH_TOKEN_PREFIX):
+                auth_token = arg[len(_AUTH_TOKEN_PREFIX):].strip('"')
+            elif arg.startswith(_APP_PORT_PREFIX):
+                port = arg[len(_APP_PORT_PREFIX):].strip('"')
+
+        if auth_token and port:
+            return auth_token, port
+
+        # Only join and scan the full command line when the fast path missed
+        cmd_str = ' '.join(cmdline)
+        if not auth_token:
+            match = _AUTH_TOKEN_RE.search(cmd_str)
+            auth_token = match.group(1) if match else None
+        if not port:
+            match = _APP_PORT_RE.search(cmd_str)
+            port = match.group(1) if match else None
+        return auth_token, port
+
+    def update_auth(self):
         """Update authentication data only if there are changes."""
         self.logger.debug("Checking authentication data...")
-        new_auth_token, new_client_port = await self.get_auth_data()
+        new_auth_token, new_client_port = self.get_auth_data()
         
         # Check if values have changed
         auth_changed = new_auth_token != self.auth_token
@@ -94,6 +142,7 @@ class LeagueClientAuth:
         if not self._monitoring:
             self.logger.info("Starting League Client monitor thread")
             self._monitoring = True
+            self._stop_event.clear()
             self._monitor_thread = Thread(target=self._monitor_client, daemon=True)
             self._monitor_thread.start()
 
@@ -102,13 +151,11 @@ class LeagueClientAuth:
         try:
             self.logger.info("Stopping League Client monitor thread")
             self._monitoring = False
+            self._stop_event.set()
             
             if self._monitor_thread and self._monitor_thread.is_alive():
-                # Give the thread more time to exit gracefully
-                for _ in range(int(3 / self._delay)):  # Try for 3 seconds (30 * 0.1)
-                    if not self._monitor_thread.is_alive():
-                        break
-                    time.sleep(0.1)
+                # Give the thread up to 3 seconds to exit gracefully
+                self._monitor_thread.join(timeout=3)
                 
                 if self._monitor_thread.is_alive():
                     self.logger.warning("Monitor thread didn't stop gracefully, forcing stop")
@@ -124,26 +171,14 @@ class LeagueClientAuth:
     def _monitor_client(self):
         """Monitor the League Client in a separate thread."""
         self.logger.debug("Monitor thread started")
-        loop = None
         try:
             while self._monitoring:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.update_auth())
+                self.update_auth()
                 
-                # Use smaller sleep intervals to check monitoring flag more frequently
-                if not self.auth_token or not self.client_port:
-                    # Sleep for 5 seconds in 0.1s intervals
-                    for _ in range(int(5 / self._delay)):  # Try for 5 seconds (5 / 0.1)
-                        if not self._monitoring:
-                            break
-                        time.sleep(0.1)
-                else:
-                    # Sleep for 30 seconds in 0.1s intervals
-                    for _ in range(int(30 / self._delay)):  # Try for 30 seconds (30 / 0.1)
-                        if not self._monitoring:
-                            break
-                        time.sleep(0.1)
+                # Poll quickly while waiting for the client, slowly once connected;
+                # stop_monitoring() wakes the wait immediately
+                timeout = 30 if self.is_client_running else 5
+                self._stop_event.wait(timeout=timeout)
                         
                 if not self._monitoring:
                     self.logger.debug("Monitoring stopped, exiting monitor loop")
@@ -152,8 +187,6 @@ class LeagueClientAuth:
         except Exception as e:
             self.logger.error(f"Error in monitor thread: {str(e)}")
         finally:
-            if loop:
-                loop.close()
             self.logger.debug("Monitor thread stopping")
 
     @property
@@ -161,17 +194,29 @@ class LeagueClientAuth:
         """Check if the League Client is running."""
         return bool(self.auth_token and self.client_port)
 
+    @property
+    def auth_token(self) -> Optional[str]:
+        """Base64 encoded LCU credentials, or None if the client isn't running."""
+        return self._auth_token
+
+    @auth_token.setter
+    def auth_token(self, value: Optional[str]):
+        """Store new credentials and rebuild the cached connection headers."""
+        self._auth_token = value
+        if value:
+            self._cached_headers = {
+                'Authorization': f'Basic {value}',
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            }
+        else:
+            self._cached_headers = {}
+
     def get_connection_headers(self) -> dict:
         """Get the headers needed for LCU API connections."""
-        if not self.auth_token:
+        if not self._cached_headers:
             self.logger.warning("No auth token available for headers")
-            return {}
-        self.logger.debug("Generated connection headers")
-        return {
-            'Authorization': f'Basic {self.auth_token}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        return self._cached_headers
         
     def __del__(self):
         """Destructor to ensure cleanup on object deletion."""
@@ -6,21 +6,35 @@ import tkinter as tk
 from tkinter import ttk
 import queue
 import logging
-from datetime import datetime
+import threading
+import time
 from typing import Dict, Optional
 
 from logger import Logger, LogLevel
-from gui.styles.theme import ColorScheme
+from gui.styles.colors import ColorScheme
+
+def _format_timestamp(created: float) -> str:
+    """Format a record creation time as 'YYYY-MM-DD HH:MM:SS.mmm'."""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created)) + f".{int((created % 1) * 1000):03d}"
 
 class LogView(ttk.Frame):
     """Log viewer with filtering and colored output."""
     
-    def __init__(self, parent, colors: ColorScheme, config=None, logger=None):
+    MAX_DRAIN = 200  # Records taken from the queue per pass before yielding to Tk
+    MAX_QUEUED = 10_000  # Oldest queued records are dropped beyond this
+    ACTIVE_POLL_MS = 100  # Flag check interval while records keep arriving
+    IDLE_POLL_MS = 1000  # Flag check interval after a check found nothing new
+    
+    def __init__(self, parent, colors: ColorScheme, config=None, logger=None, max_lines: int = 5000):
         super().__init__(parent)
         self.colors = colors
         self.config = config
         self.logger = logger or Logger()
-        self.log_queue = queue.Queue()
+        self.max_lines = max_lines  # Oldest lines are dropped beyond this
+        self._line_count = 0
+        self.log_queue = queue.Queue(maxsize=self.MAX_QUEUED)
+        self._pending = []  # (timestamp, levelname, message) entries waiting for the next flush
+        self._flush_scheduled = False
         
         # Use LogLevel enum values for consistency
         self.level_filters = {level.name: True for level in LogLevel}
@@ -96,18 +110,12 @@ class LogView(ttk.Frame):
             font=("Cascadia Code", 10, "italic")
         )
         
-    def _setup_tags(self):
-        """Configure text tags for log levels."""
-        level_colors = {
-            'DEBUG': self.colors.log_debug,
-            'INFO': self.colors.log_info,
-            'WARNING': self.colors.log_warning,
-            'ERROR': self.colors.log_error
-        }
+        # Entry visibility is driven by one shared tag per level, configured once
+        self._last_filter_state = {}
+        for level, var in self.level_filters.items():
+            self._last_filter_state[level] = var.get()
+            self.log_text.tag_configure(f"level_{level}", elide=not self._last_filter_state[level])
         
-        for level, color in level_colors.items():
-            self.log_text.tag_configure(level, foreground=color)
-            
     def _setup_logging(self):
         """Setup logging handler and queue checking."""
         # Create custom handler
@@ -118,58 +126,121 @@ class LogView(ttk.Frame):
         if self.logger and hasattr(self.logger, 'logger'):
             self.logger.logger.addHandler(self.handler)
             
-        # Start checking queue
-        self.after(100, self._check_log_queue)
+        # The handler runs on whichever thread logged and must not call into Tk,
+        # so it only raises a flag; this poll is the only reader of it
+        self.after(self.IDLE_POLL_MS, self._poll_log_queue)
+        
+    def _poll_log_queue(self):
+        """
+        Drain the queue if the handler flagged new records since the last check.
+        
+        Polls quickly while records keep arriving and backs off to once a second
+        after a check that finds nothing, so an idle log wakes Tk only once a second.
+        """
+        if self.handler.records_waiting:
+            self._check_log_queue()
+            delay = self.ACTIVE_POLL_MS
+        else:
+            delay = self.IDLE_POLL_MS
+        self.after(delay, self._poll_log_queue)
         
     def _check_log_queue(self):
         """Check for new log messages."""
-        while True:
+        # Clear before draining so records queued from now on raise the flag again
+        self.handler.records_waiting = False
+        drained_all = False
+        for _ in range(self.MAX_DRAIN):
             try:
-                record = self.log_queue.get_nowait()
-                self._add_log_message(record)
+                entry = self.log_queue.get_nowait()
+                self._pending.append(entry)
                 self.log_queue.task_done()
             except queue.Empty:
+                drained_all = True
                 break
-        
-        self.after(100, self._check_log_queue)
-        
-    def _add_log_message(self, record: logging.LogRecord):
-        """Add a log message to the text widget."""
-        # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+                
+        # Report records the handler had to drop while the queue was full
+        dropped = self.handler.take_dropped()
+        if dropped:
+            self._pending.append(
+                (_format_timestamp(time.time()), 'WARNING', f"{dropped} log messages dropped")
+            )
+            
+        # Coalesce everything drained before the next idle point into one flush
+        if self._pending and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush)
+            
+        # Hit the drain limit; yield to the event loop and continue afterwards
+        if not drained_all:
+            self.after_idle(self._check_log_queue)
+            
+    def _flush(self):
+        """Insert all pending log messages into the text widget in one batch."""
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+            
+        # Build the text and the tag ranges for the whole batch up front
+        first_line = line = int(self.log_text.index('end-1c').split('.')[0])
+        chunks = []
+        ranges: Dict[str, list] = {}
+        prev_level = None
+        for timestamp, levelname, message in pending:
+            stamp = f"[{timestamp}] "
+            prefix = f"{levelname}: "
+            entry = f"{stamp}{prefix}{message}\n"
+            chunks.append(entry)
+            
+            level_col = len(stamp)
+            ranges.setdefault('timestamp', []).extend((f"{line}.0", f"{line}.{level_col}"))
+            ranges.setdefault(levelname, []).extend(
+                (f"{line}.{level_col}", f"{line}.{level_col + len(prefix)}")
+            )
+            
+            # Tag the entire log entry with the level name so it can be filtered,
+            # extending the previous range for runs of entries at the same level
+            next_line = line + entry.count('\n')
+            level_ranges = ranges.setdefault(f"level_{levelname}", [])
+            if levelname == prev_level:
+                level_ranges[-1] = f"{next_line}.0"
+            else:
+                level_ranges.extend((f"{line}.0", f"{next_line}.0"))
+            prev_level = levelname
+            line = next_line
             
         self.log_text.configure(state='normal')
-        start_index = self.log_text.index('end-1c')
-        self.log_text.insert('end', f"[{timestamp}] ", ('timestamp',))
-        self.log_text.insert('end', f"{record.levelname}: ", (record.levelname,))
-        self.log_text.insert('end', f"{record.message}\n")
-        end_index = self.log_text.index('end-1c')
-        
-        # Add a tag for the entire log entry with the level name
-        self.log_text.tag_add(f"level_{record.levelname}", start_index, end_index)
-        
-        # Hide the entry if the filter is off
-        if not self.level_filters[record.levelname].get():
-            self.log_text.tag_configure(f"level_{record.levelname}", elide=True)
+        self.log_text.insert('end', "".join(chunks))
+        for tag, indices in ranges.items():
+            self.log_text.tag_add(tag, *indices)
+            
+        # Drop the oldest lines in a single range delete once over the cap
+        self._line_count += line - first_line
+        if self._line_count > self.max_lines:
+            excess = self._line_count - self.max_lines
+            self.log_text.delete('1.0', f"{excess + 1}.0")
+            self._line_count -= excess
             
         self.log_text.configure(state='disabled')
         self.log_text.see('end')
         
     def _apply_filters(self):
-        """Apply log level filters and save states."""
-        if not self.config:
-            return
-            
-        # Save filter states and update visibility
-        self.log_text.configure(state='normal')
+        """Apply log level filters and save states that changed."""
         for level, var in self.level_filters.items():
-            self.config.set(f'logs.filters.{level}', var.get())
+            value = var.get()
+            if value == self._last_filter_state.get(level):
+                continue
+            self._last_filter_state[level] = value
+            
             # Configure the level tag to show/hide entries
-            self.log_text.tag_configure(f"level_{level}", elide=not var.get())
-        self.log_text.configure(state='disabled')
-        
+            self.log_text.tag_configure(f"level_{level}", elide=not value)
+            if self.config:
+                self.config.set(f'logs.filters.{level}', value)
+                
     def update_theme(self, colors: ColorScheme):
         """Update component theme colors."""
+        if colors is self.colors:
+            return
         self.colors = colors
         self.log_text.configure(
             bg=colors.secondary_bg,
@@ -177,19 +248,51 @@ class LogView(ttk.Frame):
         )
         
         # Update log level colors
-        self.log_text.tag_configure('DEBUG', foreground=colors.log_debug)
-        self.log_text.tag_configure('INFO', foreground=colors.log_info)
-        self.log_text.tag_configure('WARNING', foreground=colors.log_warning)  
-        self.log_text.tag_configure('ERROR', foreground=colors.log_error)
+        for level, color in zip(
+            ('DEBUG', 'INFO', 'WARNING', 'ERROR'),
+            (colors.log_debug, colors.log_info, colors.log_warning, colors.log_error)
+        ):
+            self.log_text.tag_configure(level, foreground=color)
         
     class LogHandler(logging.Handler):
-        """Custom logging handler that writes to a queue."""
+        """
+        Custom logging handler that writes to a queue.
+        
+        emit() runs on the logging thread with the handler lock held, so it never
+        touches Tk; it queues the entry and sets records_waiting for LogView's poll.
+        """
         
         def __init__(self, queue):
             super().__init__()
             self.queue = queue
+            self.records_waiting = False  # Set by emit, cleared by the Tk thread before draining
+            self.dropped = 0  # Records discarded because the queue was full
+            self._dropped_lock = threading.Lock()
+            
+        def take_dropped(self) -> int:
+            """Return the number of dropped records and reset the count."""
+            with self._dropped_lock:
+                dropped, self.dropped = self.dropped, 0
+            return dropped
             
         def emit(self, record):
-            # Format the message before queuing
-            record.message = record.getMessage()
-            self.queue.put(record)
\ No newline at end of file
+            # Format on the logging thread so the Tk thread only inserts text
+            try:
+                entry = (_format_timestamp(record.created), record.levelname, record.getMessage())
+            except Exception:
+                self.handleError(record)
+                return
+            
+            # Never block the logging thread; drop the oldest entry when full
+            try:
+                self.queue.put_nowait(entry)
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.queue.put_nowait(entry)
+                except (queue.Empty, queue.Full):
+                    pass
+                with self._dropped_lock:
+                    self.dropped += 1
+            
+            self.records_waiting = True
\ No newline at end of file
@@ -69,16 +69,16 @@ class StatusBar(ttk.Frame):
         """Update League Client connection status."""
         status = "Connected" if connected else "Disconnected"
         self.lcu_status_var.set(status)
-        self.lcu_status.update_idletasks()
 
     def update_obs_status(self, connected: bool):
         """Update OBS connection status."""
         status = "Connected" if connected else "Disconnected"
         self.obs_status_var.set(status)  # Just set the status without "OBS:"
-        self.obs_status.update_idletasks()
     
     def update_theme(self, colors: ColorScheme):
         """Update status bar theme colors."""
+        if colors is self.colors:
+            return
         self.colors = colors
         self.configure(style="Status.TFrame")
         
@@ -6,7 +6,9 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Optional
 
-from ..styles.theme import ColorScheme  # Update import path
+from ..styles.colors import ColorScheme
+from ..styles.frames import configure_status_styles
+from ..styles.theme import get_style
 
 class StatusLabel(ttk.Label):
     """Enhanced status label with theme support."""
@@ -18,43 +20,17 @@ class StatusLabel(ttk.Label):
         self.colors = colors
         self._setup_styles()
         
-        # Handle text variable
+        # Tk redraws the label itself when a textvariable changes
         if textvariable:
-            self._textvariable = textvariable
             self.configure(textvariable=textvariable)
-            textvariable.trace_add('write', self._on_var_change)
-            # Set initial text
-            self.configure(text=textvariable.get())
-            
-    def _on_var_change(self, *args):
-        """Handle variable changes."""
-        if hasattr(self, '_textvariable'):
-            new_text = self._textvariable.get()
-            self.configure(text=new_text)
-            self.update()
-            self.update_idletasks()
         
     def _setup_styles(self):
-        """Configure label styles."""
-        style = ttk.Style()
-        
-        style.configure(
-            "Status.TLabel",
-            background=self.colors.background,
-            foreground=self.colors.accent_light,
-            font=("Arial", 9, "bold"),
-            padding=(5, 2)
-        )
-        
-        style.map(
-            "Status.TLabel", 
-            foreground=[
-                ("disabled", self.colors.disabled_fg),
-                ("readonly", self.colors.secondary_fg)
-            ]
-        )
+        """Configure label styles (shared by every status label, applied once per theme)."""
+        configure_status_styles(get_style(self), self.colors)
     
     def update_theme(self, colors: ColorScheme):
         """Update theme colors."""
+        if colors is self.colors:
+            return
         self.colors = colors
         self._setup_styles()
\ No newline at end of file
@@ -8,7 +8,7 @@ from typing import Optional
 
 from .tabs import GameTab, OBSTab, ConfigTab
 from .components import LogView, StatusBar
-from .styles import Theme, ColorScheme, DarkTheme, LightTheme, WidgetStyles
+from .styles import Theme, ThemeManager, ColorScheme, configure_frame_styles, get_style
 from .styles.notebook import configure_notebook_styles
 
 class MainWindow:
@@ -51,7 +51,7 @@ class MainWindow:
             theme_name = 'dark'
             
         self.current_theme = Theme.DARK if theme_name == 'dark' else Theme.LIGHT
-        self.colors = DarkTheme() if self.current_theme == Theme.DARK else LightTheme()
+        self.colors = ThemeManager.get_colors(self.current_theme)
         
         # Window setup
         self.window.geometry(f"{width}x{height}")
@@ -69,14 +69,14 @@ class MainWindow:
             #self.update_game_info(lcu.get_request('lol-gameflow_v1_session'))
             
         if obs:
-            self.status_bar.update_obs_status(obs.is_connected)
+            self.status_bar.update_obs_status(obs.connected)
             
         if config:
             self.config = config
         
     def _setup_styles(self):
         """Initialize theme styles."""
-        style = ttk.Style()
+        style = get_style(self.window)
         style.theme_use('clam')
         
         # Configure common styles
@@ -92,6 +92,9 @@ class MainWindow:
             font=("Arial", 8)
         )
         
+        # Shared frame/label styles used by every tab
+        configure_frame_styles(style, self.colors)
+        
         # Configure notebook styles
         configure_notebook_styles(style, self.colors)
         
@@ -109,24 +112,56 @@ class MainWindow:
         self.notebook = ttk.Notebook(self.main)
         self.notebook.pack(expand=True, fill='both')
         
-        # Initialize tabs with dependencies
+        # Only the initially visible tab is built now; the others are
+        # materialized from placeholders the first time they are selected
         self.game_tab = GameTab(self.notebook, self.colors, config=self.config)
-        self.obs_tab = OBSTab(self.notebook, self.colors, self.obs, config=self.config)
-        self.config_tab = ConfigTab(
+        self.notebook.add(self.game_tab, text="Game")
+        
+        self.obs_tab = None
+        self.config_tab = None
+        self._lazy_tabs = {}  # Placeholder widget path -> (attribute, title, factory)
+        for attr, title, factory in (
+            ('obs_tab', OBSTab.title, self._create_obs_tab),
+            ('config_tab', ConfigTab.title, self._create_config_tab)
+        ):
+            placeholder = ttk.Frame(self.notebook)
+            self.notebook.add(placeholder, text=title)
+            self._lazy_tabs[str(placeholder)] = (attr, title, factory)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
+        # Log view
+        self.log_view = LogView(self.window, self.colors, self.config, self.logger)
+        self.log_view.pack(fill='x', padx=5, pady=5)
+        
+    def _create_obs_tab(self):
+        """Build the OBS tab."""
+        return OBSTab(self.notebook, self.colors, self.obs, config=self.config)
+        
+    def _create_config_tab(self):
+        """Build the settings tab."""
+        return ConfigTab(
             parent=self.notebook,
             colors=self.colors,
             config=self.config,  # Make sure config is properly passed
             callback=self._handle_config_changed
         )
         
-        # Add tabs
-        self.notebook.add(self.game_tab, text="Game")
-        self.notebook.add(self.obs_tab, text="OBS")
-        self.notebook.add(self.config_tab, text="Settings")
+    def _on_tab_changed(self, event=None):
+        """Replace a placeholder with its real tab the first time it is selected."""
+        selected = self.notebook.select()
+        lazy = self._lazy_tabs.pop(selected, None)
+        if lazy is None:
+            return
+            
+        attr, title, factory = lazy
+        index = self.notebook.index(selected)
+        tab = factory()
+        setattr(self, attr, tab)
         
-        # Log view
-        self.log_view = LogView(self.window, self.colors, self.config, self.logger)
-        self.log_view.pack(fill='x', padx=5, pady=5)
+        self.notebook.forget(index)
+        self.notebook.insert(index, tab, text=title)
+        self.notebook.select(tab)
+        self.window.nametowidget(selected).destroy()
         
     def start(self):
         """Start the GUI event loop."""
@@ -139,15 +174,18 @@ class MainWindow:
             
     def update_theme(self, colors: ColorScheme):
         """Update theme colors."""
+        if colors is self.colors:
+            return
         self.colors = colors
         self._setup_styles()
         
         # Update child components
         self.status_bar.update_theme(colors)
         self.log_view.update_theme(colors)
-        self.game_tab.update_theme(colors)
-        self.obs_tab.update_theme(colors)
-        self.config_tab.update_theme(colors)
+        # Tabs that haven't been built yet pick up the current colors on creation
+        for tab in (self.game_tab, self.obs_tab, self.config_tab):
+            if tab is not None:
+                tab.update_theme(colors)
         
     def _handle_config_changed(self):
         """Handle configuration changes."""
@@ -157,8 +195,7 @@ class MainWindow:
         
         if new_theme != self.current_theme:
             self.current_theme = new_theme
-            self.colors = DarkTheme() if new_theme == Theme.DARK else LightTheme()
-            self.update_theme(self.colors)
+            self.update_theme(ThemeManager.get_colors(new_theme))
             
     def _handle_obs_connection(self, connected: bool):
         """Handle OBS connection status changes."""
@@ -191,7 +228,7 @@ class MainWindow:
         except AttributeError as e:
             if self.logger:
                 self.logger.error(f"Missing required attribute for game updates: {e}")
-                self.logger.debug(f"Game info update failed - type: {game_type}, data: {game_info}")
+                self.logger.debug("Game info update failed - type: %s, data: %s", game_type, game_info)
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Failed to update game info: {e}")
\ No newline at end of file
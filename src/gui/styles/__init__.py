@@ -3,16 +3,19 @@ GUI styling package.
 Exports theme and style definitions.
 """
 
-from .theme import Theme
-from .colors import ColorScheme, DarkColors as DarkTheme, LightColors as LightTheme
+from .theme import Theme, ThemeManager, get_style
+from .colors import ColorScheme, DarkColors as DarkTheme, LightColors as LightTheme, color_diff
 from .widgets import WidgetStyles
 from .frames import configure_frame_styles, configure_status_styles
 
 __all__ = [
     'Theme',
+    'ThemeManager',
+    'get_style',
     'ColorScheme',
     'DarkTheme',
     'LightTheme',
+    'color_diff',
     'WidgetStyles',
     'configure_frame_styles',
     'configure_status_styles'
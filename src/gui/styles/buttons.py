@@ -1,7 +1,7 @@
 """Button style configurations."""
 
 from tkinter import ttk
-from .theme import ColorScheme
+from .colors import ColorScheme
 
 def configure_button_styles(style: ttk.Style, colors: ColorScheme):
     """Configure button styles."""
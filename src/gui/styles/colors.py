@@ -2,11 +2,12 @@
 Color definitions for application themes.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import Dict
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColorScheme:
-    """Base color scheme definition."""
+    """Base color scheme definition (immutable, shared via ThemeManager)."""
     # Primary colors
     primary: str
     accent: str
@@ -35,6 +36,7 @@ class ColorScheme:
 
 class DarkColors(ColorScheme):
     """Dark theme color palette with purple accents."""
+    __slots__ = ()
     
     def __init__(self):
         super().__init__(
@@ -67,6 +69,7 @@ class DarkColors(ColorScheme):
 
 class LightColors(ColorScheme):
     """Light theme color palette."""
+    __slots__ = ()
     
     def __init__(self):
         super().__init__(
@@ -95,4 +98,22 @@ class LightColors(ColorScheme):
             # UI elements
             border="#DEDEE3",        # Light border
             focus_border="#772CE8"    # Purple focus
-        )
\ No newline at end of file
+        )
+
+def color_diff(old: ColorScheme, new: ColorScheme) -> Dict[str, str]:
+    """
+    Get the color fields that differ between two schemes.
+    
+    Args:
+        old: The scheme currently applied
+        new: The scheme being applied
+        
+    Returns:
+        Dict[str, str]: Field name to new color for every changed field
+    """
+    diff = {}
+    for field in fields(ColorScheme):
+        value = getattr(new, field.name)
+        if getattr(old, field.name) != value:
+            diff[field.name] = value
+    return diff
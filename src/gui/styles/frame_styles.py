@@ -3,7 +3,7 @@ Frame and label style configurations.
 """
 
 from tkinter import ttk
-from .theme import ColorScheme
+from .colors import ColorScheme
 
 def configure_frame_styles(style: ttk.Style, colors: ColorScheme):
     """Configure frame and label styles."""
@@ -39,8 +39,15 @@ def configure_frame_styles(style: ttk.Style, colors: ColorScheme):
         background=colors.background
     )
 
+# Color scheme the shared status style was last configured with
+_status_styles_colors = None
+
 def configure_status_styles(style: ttk.Style, colors: ColorScheme):
-    """Configure status display styles."""
+    """Configure status display styles, skipping the Tcl calls if already applied for colors."""
+    global _status_styles_colors
+    if colors is _status_styles_colors:
+        return
+    _status_styles_colors = colors
     
     style.configure(
         "Status.TLabel",
@@ -3,7 +3,7 @@ Notebook styling configuration.
 """
 
 from tkinter import ttk
-from .theme import ColorScheme
+from .colors import ColorScheme
 
 def configure_notebook_styles(style: ttk.Style, colors: ColorScheme):
     """Configure notebook and tab styles."""
@@ -3,7 +3,7 @@ Widget style configurations for the GUI.
 """
 
 from tkinter import ttk
-from .theme import ColorScheme
+from .colors import ColorScheme
 
 class WidgetStyles:
     """Configure ttk widget styles based on theme colors."""
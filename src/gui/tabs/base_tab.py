@@ -24,4 +24,6 @@ class BaseTab(ttk.Frame):
         
     def update_theme(self, colors: ColorScheme):
         """Update tab with new theme colors."""
+        if colors is self.colors:
+            return
         self.colors = colors
\ No newline at end of file
@@ -9,9 +9,16 @@ from typing import Callable, Optional
 # Fix the import path for ColorScheme
 from ..styles import ColorScheme
 
-from ..components import StatusLabel
 from .base_tab import BaseTab
 
+# Style applied on theme changes, by widget class
+_WIDGET_STYLES = {
+    ttk.LabelFrame: "Main.TLabelframe",
+    ttk.Label: "Title.TLabel",
+    ttk.Entry: "TEntry",
+    ttk.Checkbutton: "TCheckbutton",
+    ttk.Radiobutton: "TRadiobutton"
+}
 
 class ConfigTab(ttk.Frame):
     """Settings and configuration interface."""
@@ -23,29 +30,30 @@ class ConfigTab(ttk.Frame):
         self.colors = colors
         self.config = config
         self.callback = callback
-        # Initialize variables with defaults
-        self.theme_var = tk.StringVar(value='dark')
-        self.obs_host = tk.StringVar(value='localhost')
-        self.obs_port = tk.StringVar(value='4455')
-        self.obs_password = tk.StringVar(value='')
-        self.obs_autoconnect = tk.BooleanVar(value=False)
+        self._last_styles = {}  # Widget path -> style last applied by update_theme
+        self._themed_widgets = []  # (widget, style) pairs registered in _setup_gui
+        self._save_after_id = None  # Pending debounced save
+        self._save_notify = False  # Whether the pending save should confirm with a dialog
+        self._filter_after_id = None  # Pending debounced log filter write
+        self._dirty_filters = set()  # Log levels toggled since the last filter write
+        self._validate_port_cmd = self.register(self._validate_port)  # Tcl command for the port entry
         
-        # Store references
-        self.config = config
-        self.callback = callback
-        
-        # Load config if available
-        if self.config:
-            self.theme_var.set(config.get('theme', 'dark'))
-            self.obs_host.set(config.get('obs.host', 'localhost'))
-            self.obs_port.set(str(config.get('obs.port', 4455)))
-            self.obs_password.set(config.get('obs.password', ''))
-            self.obs_autoconnect.set(config.get('obs.auto_connect', False))
+        # Initialize variables from config, falling back to defaults
+        get = config.get if config else (lambda key, default: default)
+        self.theme_var = tk.StringVar(value=get('theme', 'dark'))
+        self.obs_host = tk.StringVar(value=get('obs.host', 'localhost'))
+        self.obs_port = tk.StringVar(value=str(get('obs.port', 4455)))
+        self.obs_password = tk.StringVar(value=get('obs.password', ''))
+        self.obs_autoconnect = tk.BooleanVar(value=get('obs.auto_connect', False))
         
         self._setup_gui()
 
     def _setup_gui(self):
         """Setup configuration interface."""
+        # One <Return> binding on a tab-specific bindtag serves every entry
+        self._save_tag = f"ConfigSave{id(self)}"
+        self.bind_class(self._save_tag, '<Return>', lambda e: self._save_settings())
+        
         # Theme settings
         theme_frame = ttk.LabelFrame(
             self, 
@@ -53,24 +61,29 @@ class ConfigTab(ttk.Frame):
             style="Main.TLabelframe"
         )
         theme_frame.pack(fill='x', padx=5, pady=5)
+        self._register_themed(theme_frame)
         
-        ttk.Radiobutton(
+        dark_radio = ttk.Radiobutton(
             theme_frame,
             text="Dark Theme",
             value="dark",
             variable=self.theme_var,
             command=self._save_settings,
             style="TRadiobutton"
-        ).pack(side='left', padx=10, pady=5)
+        )
+        dark_radio.pack(side='left', padx=10, pady=5)
+        self._register_themed(dark_radio)
         
-        ttk.Radiobutton(
+        light_radio = ttk.Radiobutton(
             theme_frame,
             text="Light Theme", 
             value="light",
             variable=self.theme_var,
             command=self._save_settings,
             style="TRadiobutton"
-        ).pack(side='left', padx=10, pady=5)
+        )
+        light_radio.pack(side='left', padx=10, pady=5)
+        self._register_themed(light_radio)
         
         # OBS Settings
         obs_frame = ttk.LabelFrame(
@@ -79,53 +92,62 @@ class ConfigTab(ttk.Frame):
             style="Main.TLabelframe"
         )
         obs_frame.pack(fill='x', padx=5, pady=5)
+        self._register_themed(obs_frame)
         
         # Host setting
         host_frame = ttk.Frame(obs_frame)
         host_frame.pack(fill='x', padx=5, pady=2)
         
-        ttk.Label(
+        host_label = ttk.Label(
             host_frame,
             text="Host:",
             style="Title.TLabel"
-        ).pack(side='left', padx=5)
+        )
+        host_label.pack(side='left', padx=5)
+        self._register_themed(host_label)
         
         host_entry = ttk.Entry(
             host_frame,
             textvariable=self.obs_host
         )
         host_entry.pack(side='left', padx=5, fill='x', expand=True)
-        host_entry.bind('<Return>', lambda e: self._save_settings())
+        host_entry.bindtags(host_entry.bindtags() + (self._save_tag,))
+        self._register_themed(host_entry)
         
         # Port setting
         port_frame = ttk.Frame(obs_frame)
         port_frame.pack(fill='x', padx=5, pady=2)
         
-        ttk.Label(
+        port_label = ttk.Label(
             port_frame,
             text="Port:",
             style="Title.TLabel"
-        ).pack(side='left', padx=5)
+        )
+        port_label.pack(side='left', padx=5)
+        self._register_themed(port_label)
         
         port_entry = ttk.Entry(
             port_frame,
             textvariable=self.obs_port,
             width=10,
             validate='key',
-            validatecommand=(self.register(self._validate_port), '%P')
+            validatecommand=(self._validate_port_cmd, '%P')
         )
         port_entry.pack(side='left', padx=5)
-        port_entry.bind('<Return>', lambda e: self._save_settings())
+        port_entry.bindtags(port_entry.bindtags() + (self._save_tag,))
+        self._register_themed(port_entry)
         
         # Password setting
         pass_frame = ttk.Frame(obs_frame)
         pass_frame.pack(fill='x', padx=5, pady=2)
         
-        ttk.Label(
+        pass_label = ttk.Label(
             pass_frame,
             text="Password:",
             style="Title.TLabel"
-        ).pack(side='left', padx=5)
+        )
+        pass_label.pack(side='left', padx=5)
+        self._register_themed(pass_label)
         
         password_entry = ttk.Entry(
             pass_frame,
@@ -133,16 +155,19 @@ class ConfigTab(ttk.Frame):
             show="*"
         )
         password_entry.pack(side='left', padx=5, fill='x', expand=True)
-        password_entry.bind('<Return>', lambda e: self._save_settings())
+        password_entry.bindtags(password_entry.bindtags() + (self._save_tag,))
+        self._register_themed(password_entry)
         
         # Auto-connect setting
-        ttk.Checkbutton(
+        autoconnect_check = ttk.Checkbutton(
             obs_frame,
             text="Auto-connect on startup",
             variable=self.obs_autoconnect,
             command=self._save_settings,
             style="TCheckbutton"
-        ).pack(padx=5, pady=5)
+        )
+        autoconnect_check.pack(padx=5, pady=5)
+        self._register_themed(autoconnect_check)
         
         # Log filters
         log_frame = ttk.LabelFrame(
@@ -151,16 +176,19 @@ class ConfigTab(ttk.Frame):
             style="Main.TLabelframe"
         )
         log_frame.pack(fill='x', padx=5, pady=5)
+        self._register_themed(log_frame)
         
         # Log level filters with default values if no config
         filter_frame = ttk.Frame(log_frame)
         filter_frame.pack(fill='x', padx=5, pady=5)
         
-        ttk.Label(
+        filter_label = ttk.Label(
             filter_frame,
             text="Show log levels:",
             style="Title.TLabel"
-        ).pack(side='left', padx=5)
+        )
+        filter_label.pack(side='left', padx=5)
+        self._register_themed(filter_label)
         
         # Store filter variables
         self.log_filters = {}
@@ -183,19 +211,39 @@ class ConfigTab(ttk.Frame):
                 style="TCheckbutton"
             )
             cb.pack(side='left', padx=5)
+            self._register_themed(cb)
+            
+        # Explicit save with confirmation
+        ttk.Button(
+            self,
+            text="Save Settings",
+            command=lambda: self._save_settings(notify=True),
+            style="Accent.TButton"
+        ).pack(anchor='e', padx=5, pady=5)
 
     def _validate_port(self, value):
         """Validate port number input."""
-        if value == "":
-            return True
-        try:
-            port = int(value)
-            return 0 <= port <= 65535
-        except ValueError:
-            return False
+        return value == "" or (
+            value.isascii() and value.isdigit() and len(value) <= 5 and int(value) <= 65535
+        )
 
-    def _save_settings(self):
+    def _save_settings(self, notify: bool = False):
+        """
+        Schedule a settings save, coalescing rapid changes into a single write.
+        
+        Args:
+            notify (bool): Show a confirmation dialog once saved. Only explicit
+                           saves ask for this; auto-saves stay silent.
+        """
+        self._save_notify = self._save_notify or notify
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(100, self._do_save)
+
+    def _do_save(self):
         """Save current settings to config."""
+        self._save_after_id = None
+        notify, self._save_notify = self._save_notify, False
         
         if not self.config:
             messagebox.showerror(
@@ -205,9 +253,12 @@ class ConfigTab(ttk.Frame):
             return
 
         try:
+            # Parse the port before writing anything, so a bad value leaves the OBS settings untouched
+            port = int(self.obs_port.get())
+            
             # Save OBS settings
             self.config.set('obs.host', self.obs_host.get())
-            self.config.set('obs.port', int(self.obs_port.get()))
+            self.config.set('obs.port', port)
             self.config.set('obs.password', self.obs_password.get())
             self.config.set('obs.auto_connect', self.obs_autoconnect.get())
             
@@ -218,11 +269,12 @@ class ConfigTab(ttk.Frame):
             for level, var in self.log_filters.items():
                 self.config.set(f'logs.filters.{level}', var.get())
             
-            # Show success message
-            messagebox.showinfo(
-                "Settings Saved",
-                "Your settings have been saved successfully."
-            )
+            # Show success message for explicit saves only
+            if notify:
+                messagebox.showinfo(
+                    "Settings Saved",
+                    "Your settings have been saved successfully."
+                )
             
             # Trigger callback if provided (e.g., for theme changes)
             if self.callback:
@@ -239,26 +291,47 @@ class ConfigTab(ttk.Frame):
         if not self.config or level not in self.log_filters:
             return
             
-        self.config.set(f'logs.filters.{level}', self.log_filters[level].get())
+        # Toggles get their own debounced write of just the filter keys; the full
+        # save would also rewrite (and possibly reconnect) the OBS settings
+        self._dirty_filters.add(level)
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(100, self._do_save_log_filters)
+
+    def _do_save_log_filters(self):
+        """Write the log filters toggled since the last write."""
+        self._filter_after_id = None
+        levels, self._dirty_filters = self._dirty_filters, set()
+        try:
+            for level in levels:
+                self.config.set(f'logs.filters.{level}', self.log_filters[level].get())
+        except Exception as e:
+            messagebox.showerror(
+                "Error Saving Settings",
+                f"Failed to save log filters: {str(e)}"
+            )
 
     def update_theme(self, colors: ColorScheme):
         """Update the tab's theme colors."""
+        if colors is self.colors:
+            return
         self.colors = colors
         
-        # Update all widget styles
-        for child in self.winfo_children():
-            if isinstance(child, ttk.LabelFrame):
-                child.configure(style="Main.TLabelframe")
-                for subchild in child.winfo_children():
-                    if isinstance(subchild, ttk.Label):
-                        subchild.configure(style="Title.TLabel")
-                    elif isinstance(subchild, ttk.Frame):
-                        for widget in subchild.winfo_children():
-                            if isinstance(widget, ttk.Label):
-                                widget.configure(style="Title.TLabel")
-                            elif isinstance(widget, ttk.Entry):
-                                widget.configure(style="TEntry")
-                            elif isinstance(widget, ttk.Checkbutton):
-                                widget.configure(style="TCheckbutton")
-                            elif isinstance(widget, ttk.Radiobutton):
-                                widget.configure(style="TRadiobutton")
\ No newline at end of file
+        # Collect style changes for all registered widgets and apply them in one Tcl call
+        commands = []
+        for widget, style in self._themed_widgets:
+            self._queue_style(widget, style, commands)
+            
+        if commands:
+            self.tk.eval("\n".join(commands))
+            
+    def _register_themed(self, widget):
+        """Remember a widget so update_theme can restyle it according to its type."""
+        self._themed_widgets.append((widget, _WIDGET_STYLES[type(widget)]))
+        
+    def _queue_style(self, widget, style: str, commands: list):
+        """Queue a style reconfigure command unless the widget already has that style."""
+        path = widget._w
+        if self._last_styles.get(path) != style:
+            self._last_styles[path] = style
+            commands.append(f"{path} configure -style {style}")
@@ -6,7 +6,7 @@ import tkinter as tk
 from tkinter import ttk
 
 from ..components import StatusLabel
-from ..styles import ColorScheme, configure_frame_styles, configure_status_styles
+from ..styles import ColorScheme
 from .base_tab import BaseTab
 
 class GameTab(BaseTab):
@@ -20,16 +20,8 @@ class GameTab(BaseTab):
         self.champion_var = tk.StringVar(value="No champion selected")
         super().__init__(parent, colors, config, logger)
         
-    def _setup_styles(self):
-        """Configure tab-specific styles."""
-        style = ttk.Style()
-        configure_frame_styles(style, self.colors)
-        configure_status_styles(style, self.colors)
-        
     def _setup_gui(self):
         """Setup game tab interface."""
-        self._setup_styles()
-        
         # Game status frame
         status_frame = ttk.LabelFrame(
             self,
@@ -72,8 +64,9 @@ class GameTab(BaseTab):
         
     def update_theme(self, colors):
         """Update component theme."""
+        if colors is self.colors:
+            return
         self.colors = colors
-        self._setup_styles()
         
         # Update all status labels
         for child in self.winfo_children():
@@ -90,7 +83,7 @@ class GameTab(BaseTab):
         """
         try:
             if self.logger:
-                self.logger.debug(f"Received game update - type: {game_type}, info: {game_info}")
+                self.logger.debug("Received game update - type: %s, info: %s", game_type, game_info)
                 
             # Validate input
             if not isinstance(game_info, dict):
@@ -7,6 +7,7 @@ from tkinter import ttk, messagebox
 from typing import Optional, Callable
 
 from ..components import StatusLabel, ConnectionPanel
+from ..styles import color_diff
 from .base_tab import BaseTab
 
 class OBSTab(BaseTab):
@@ -20,6 +21,10 @@ class OBSTab(BaseTab):
         self.connection_status = tk.StringVar(value="Disconnected")
         self.current_scene = tk.StringVar(value="No scene")
         self.scenes = []
+        self._scene_index = {}  # Scene name -> position in self.scenes
+        self._pending_refresh = False  # Set while a _flush_scenes call is scheduled
+        self._pending_scenes = None  # Latest scene list not yet rendered
+        self._pending_scene = None  # Latest current scene not yet rendered
         super().__init__(parent, colors, config)
         
         # Set up OBS client if provided
@@ -34,25 +39,27 @@ class OBSTab(BaseTab):
             self.obs.add_connection_handler(self._handle_obs_connection)
             
             # Update UI based on current connection state
-            self._handle_obs_connection(self.obs.is_connected)
+            self._handle_obs_connection(self.obs.connected)
 
     def _handle_obs_connection(self, connected: bool):
         """Handle OBS connection state changes."""
         if connected:
             self.connection_status.set("Connected")
-            self._refresh_scenes()
             self.scene_list.configure(state='normal')
-            # Get and set current scene
-            self.obs.get_current_scene(callback=self._update_current_scene)
+            # Scenes and the current scene arrive together in one batch
+            self._refresh_scenes()
         else:
             self.connection_status.set("Disconnected")
             self.scenes.clear()
+            self._scene_index.clear()
+            self._pending_scenes = None
+            self._pending_scene = None
             self.scene_list.delete(0, tk.END)
             self.current_scene.set("No scene")
             self.scene_list.configure(state='disabled')
 
         if self.logger:
-            self.logger.info(f"OBS {'connected' if connected else 'disconnected'}")
+            self.logger.info("OBS %s", 'connected' if connected else 'disconnected')
 
     def _setup_gui(self):
         """Setup OBS tab interface."""
@@ -141,10 +148,8 @@ class OBSTab(BaseTab):
                 messagebox.showerror("Error", "OBS client not initialized")
                 return
                 
-            self.obs.connect()
-            
-            # Check connection status after a short delay
-            self.after(500, self._check_connection_status)
+            # Success is reported through _handle_obs_connection
+            self.obs.connect(callback=self._on_connect_result)
             
         except Exception as e:
             if self.logger:
@@ -152,17 +157,10 @@ class OBSTab(BaseTab):
             messagebox.showerror("Connection Error", f"Failed to connect to OBS: {e}")
             self.connection_status.set("Connection Failed")
 
-    def _check_connection_status(self):
-        """Check if OBS connection was successful."""
-        if self.obs and self.obs.is_connected:
-            self.connection_status.set("Connected")
-            self._refresh_scenes()
-            # Get and set current scene
-            self.obs.get_current_scene(callback=self._update_current_scene)
-        else:
-            # If not connected, try checking again after a delay
-            if self.connection_status.get() != "Connection Failed":
-                self.after(500, self._check_connection_status)
+    def _on_connect_result(self, success: bool):
+        """Handle the result of a connection attempt started from this tab."""
+        if not success:
+            self.connection_status.set("Connection Failed")
     
     def _disconnect_obs(self):
         """Disconnect from OBS WebSocket server."""
@@ -176,19 +174,15 @@ class OBSTab(BaseTab):
     def _refresh_scenes(self):
         """Refresh scene list from OBS."""
         try:
-            if not self.obs or not self.obs.is_connected:
+            if not self.obs or not self.obs.connected:
                 return
                 
-            def on_scenes_received(scenes):
-                self.scenes = scenes
-                self.scene_list.delete(0, tk.END)
-                self.scene_list.configure(state='normal')
-                for scene in self.scenes:
-                    self.scene_list.insert(tk.END, scene)
-                # Update current scene selection after refreshing list
-                self.obs.get_current_scene(callback=self._update_current_scene)
+            def on_refresh(profiles, scenes, current_scene):
+                self._pending_scenes = scenes
+                self._pending_scene = current_scene
+                self._schedule_scene_flush()
                 
-            self.obs.get_scene_list(callback=on_scenes_received)
+            self.obs.refresh_all(callback=on_refresh)
                 
         except Exception as e:
             if self.logger:
@@ -197,7 +191,7 @@ class OBSTab(BaseTab):
     
     def _switch_scene(self):
         """Switch to selected scene."""
-        if not self.obs or not self.obs.is_connected:  # Changed from .connected to .is_connected
+        if not self.obs or not self.obs.connected:
             return
             
         selection = self.scene_list.curselection()
@@ -215,11 +209,51 @@ class OBSTab(BaseTab):
 
     def _update_current_scene(self, scene_name):
         """Update current scene display."""
-        self.current_scene.set(scene_name)
-        # Select the current scene in the list
-        for i, scene in enumerate(self.scenes):
-            if scene == scene_name:
+        self._pending_scene = scene_name
+        self._schedule_scene_flush()
+        
+    def _schedule_scene_flush(self):
+        """Render the latest scene data once the event loop is idle."""
+        if not self._pending_refresh:
+            self._pending_refresh = True
+            self.after_idle(self._flush_scenes)
+            
+    def _flush_scenes(self):
+        """Apply the most recent scene list and current scene to the widgets."""
+        self._pending_refresh = False
+        scenes, self._pending_scenes = self._pending_scenes, None
+        scene_name, self._pending_scene = self._pending_scene, None
+        
+        if scenes is not None:
+            self.scene_list.configure(state='normal')
+            # Only rebuild the list when it changed, keeping the selection otherwise
+            if scenes != self.scenes:
+                self.scenes = scenes
+                self._scene_index = {scene: i for i, scene in enumerate(scenes)}
+                self.scene_list.delete(0, tk.END)
+                if self.scenes:
+                    self.scene_list.insert(tk.END, *self.scenes)
+            
+        if scene_name is not None:
+            self.current_scene.set(scene_name)
+            # Select the current scene in the list
+            i = self._scene_index.get(scene_name)
+            if i is not None:
                 self.scene_list.selection_clear(0, tk.END)
                 self.scene_list.selection_set(i)
                 self.scene_list.see(i)
-                break
\ No newline at end of file
+                
+    def update_theme(self, colors):
+        """Update tab colors, reconfiguring only the scene list colors that changed."""
+        if colors is self.colors:
+            return
+        changed = color_diff(self.colors, colors)
+        super().update_theme(colors)
+        
+        options = {}
+        if 'secondary_bg' in changed:
+            options['bg'] = colors.secondary_bg
+        if 'foreground' in changed:
+            options['fg'] = colors.foreground
+        if options:
+            self.scene_list.configure(**options)
@@ -3,7 +3,10 @@ Logging system configuration.
 Handles both file and console output with proper formatting.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from enum import Enum
 from pathlib import Path
@@ -19,14 +22,129 @@ class LogLevel(Enum):
     WARNING = logging.WARNING
     ERROR = logging.ERROR
 
+class _BufferedFileHandler(logging.StreamHandler):
+    """File handler that opens its file on first use and batches writes in a large buffer."""
+    
+    def __init__(self, filename, encoding: str = 'utf-8', buffer_size: int = 65536):
+        super().__init__()
+        self.stream = None
+        self.baseFilename = str(filename)
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        
+    def emit(self, record):
+        if self.stream is None:
+            try:
+                self.stream = open(self.baseFilename, 'a', encoding=self.encoding, buffering=self.buffer_size)
+            except Exception:
+                self.handleError(record)
+                return
+        super().emit(record)
+        
+        # Make sure problems reach the disk even if the process dies afterwards
+        if record.levelno >= logging.WARNING:
+            self.stream.flush()
+            
+    def flush(self):
+        """Skip per-record flushes; the buffer is flushed on warnings and on close."""
+        
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream:
+                try:
+                    self.stream.flush()
+                finally:
+                    self.stream.close()
+                    self.stream = None
+        finally:
+            self.release()
+        super().close()
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that drops records instead of blocking when the queue is full.
+    
+    Only records below WARNING are dropped; warnings and errors wait for room.
+    Once there is room again, a single warning reports how many were dropped.
+    """
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0  # Only touched inside emit, under the handler lock
+        
+    def enqueue(self, record):
+        if self.dropped:
+            self._report_dropped(record.name)
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record)
+            else:
+                # A stalled disk must not stall the LCU/OBS event handlers that log
+                self.dropped += 1
+                
+    def _report_dropped(self, name: str):
+        """Queue a warning with the number of dropped records, if there is room for it."""
+        summary = logging.LogRecord(
+            name, logging.WARNING, __file__, 0,
+            f"{self.dropped} log records dropped while the log queue was full", None, None
+        )
+        try:
+            self.queue.put_nowait(summary)
+        except queue.Full:
+            return
+        self.dropped = 0
+
+class _QueueListener(logging.handlers.QueueListener):
+    """Queue listener whose shutdown waits for room instead of failing on a full queue."""
+    
+    def enqueue_sentinel(self):
+        # The listener thread is still draining, so a blocking put always gets in
+        self.queue.put(self._sentinel)
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted date/time for records within the same second."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_sec = -1
+        self._cached_time = ''
+        
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_sec = sec
+        return self._cached_time
+
 class Logger:
-    """Centralized logging configuration."""
+    """Centralized logging configuration, shared by every component as a single instance."""
+    
+    _instance: Optional['Logger'] = None
+    
+    def __new__(cls, log_dir: Optional[str] = None):
+        # Every component calls Logger(); hand back the one configured instance
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
     
     def __init__(self, log_dir: Optional[str] = None):
-        """Initialize logging system."""
+        """Initialize logging system on first use; later calls are no-ops."""
+        if self._initialized:
+            return
+        self._initialized = True
+        
         self.logger = logging.getLogger('LeagueOBS')
         self.logger.setLevel(LogLevel.DEBUG.value)
         
+        # None of the formatters use thread/process fields; skip collecting them per record
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        
         # Prevent duplicate handlers
         if self.logger.handlers:
             return
@@ -44,9 +162,9 @@ class Logger:
         log_file = log_dir / f"league_obs_{timestamp}.log"
         
         # File handler with detailed formatting
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = _BufferedFileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(logging.Formatter(
+        file_handler.setFormatter(_CachedTimeFormatter(
             '%(asctime)s.%(msecs)03d %(levelname)-8s %(name)s: %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         ))
@@ -56,28 +174,37 @@ class Logger:
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(ColoredFormatter())
         
-        # Add handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Formatting and I/O run on a listener thread; logging callers only enqueue.
+        # The queue is bounded so a stalled writer can't grow memory without limit
+        log_queue = queue.Queue(maxsize=10_000)
+        self.logger.addHandler(_DroppingQueueHandler(log_queue))
+        self._listener = _QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        
+        # atexit runs in reverse order: stop the listener first, then flush the file
+        atexit.register(file_handler.close)
+        atexit.register(self._listener.stop)
         
         self.logger.info("Logging system initialized")
         self.logger.debug(f"Log file created at: {log_file}")
     
-    def debug(self, msg: str):
-        """Log debug message."""
-        self.logger.debug(msg)
+    def debug(self, msg: str, *args):
+        """Log debug message, deferring %-style formatting of args to the logger."""
+        self.logger.debug(msg, *args)
     
-    def info(self, msg: str):
-        """Log info message."""
-        self.logger.info(msg)
+    def info(self, msg: str, *args):
+        """Log info message, deferring %-style formatting of args to the logger."""
+        self.logger.info(msg, *args)
     
-    def warning(self, msg: str):
-        """Log warning message."""
-        self.logger.warning(msg)
+    def warning(self, msg: str, *args):
+        """Log warning message, deferring %-style formatting of args to the logger."""
+        self.logger.warning(msg, *args)
     
-    def error(self, msg: str):
-        """Log error message."""
-        self.logger.error(msg)
+    def error(self, msg: str, *args):
+        """Log error message, deferring %-style formatting of args to the logger."""
+        self.logger.error(msg, *args)
 
 # Make sure LogLevel is available when importing from logger
 __all__ = ['Logger', 'LogLevel']
\ No newline at end of file
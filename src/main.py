@@ -10,21 +10,24 @@ This module sets up the core application components:
 """
 
 import sys
-from typing import Optional
+import threading
+import time
+from typing import Any, Callable, Optional, TYPE_CHECKING
 
 # Core components
 from auth import LeagueClientAuth 
 from api import LCUApi
-from obs_client import OBSClient
 
-# UI and state management
-from gui import GUI  # This will now work correctly
+# State management
 from logic import GameTracker
 
 # Utilities
 from logger import Logger
 from config import ConfigManager
 
+if TYPE_CHECKING:
+    from obs_client import OBSClient
+
 class Application:
     """
     Main application controller that manages component lifecycle.
@@ -39,6 +42,8 @@ class Application:
         tracker (GameTracker): Game state tracker
     """
     
+    __slots__ = ('logger', 'config', 'auth', 'api', 'obs', 'tracker', 'gui', '_stoppables')
+    
     def __init__(self):
         """Initialize application components."""
         # Initialize logger first with proper setup
@@ -62,17 +67,20 @@ class Application:
         self.auth = LeagueClientAuth()
         self.api = LCUApi(self.auth)
         
-        # Initialize OBS client
+        # Initialize OBS client; its WebSocket stack is only imported once it's needed
+        from obs_client import OBSClient
         self.obs = OBSClient(
             host=self.config.get('obs.host', 'localhost'),
             port=self.config.get('obs.port', 4455),
-            password=self.config.get('obs.password', '')
+            password=self.config.get('obs.password', ''),
+            logger=self.logger
         )
         
         # Initialize game tracker before GUI
         self.tracker = GameTracker(self.auth, self.api, self.obs)
         
-        # Create GUI with all dependencies
+        # Create GUI with all dependencies; tkinter loads here rather than at import
+        from gui import GUI
         self.gui = GUI(
             obs=self.obs,
             config=self.config,
@@ -84,6 +92,9 @@ class Application:
         # Set up event handlers
         self.config.add_change_handler('obs', self._handle_obs_config_change)
         self.auth.add_connection_callback(self._handle_lcu_connection)
+        
+        # Network client shutdown methods, stopped together by _cleanup
+        self._stoppables = (self.auth.stop_monitoring, self.api.stop, self.obs.stop)
 
     def _handle_obs_config_change(self, changes: dict):
         """Handle OBS configuration changes."""
@@ -97,12 +108,14 @@ class Application:
         """Handle LCU connection status changes."""
         self.gui.update_lcu_status(connected)
 
-    def _setup_obs(self) -> OBSClient:
+    def _setup_obs(self) -> 'OBSClient':
         """Initialize OBS client with config settings."""
+        from obs_client import OBSClient
         return OBSClient(
             host=self.config.get('obs.host', 'localhost'),
             port=self.config.get('obs.port', 4455),
-            password=self.config.get('obs.password', '')
+            password=self.config.get('obs.password', ''),
+            logger=self.logger
         )
 
     def start(self):
@@ -138,20 +151,31 @@ class Application:
 
     def _cleanup(self):
         """Clean up and stop all components."""
-        components = [
-            self.tracker,
-            self.auth,
-            self.api,
-            self.obs,
-            self.gui
-        ]
+        # Tracker first, since stopping it may still send a stop-recording request to OBS
+        self._stop_component(self.tracker.stop)
         
-        for component in components:
-            try:
-                if hasattr(component, 'stop'):
-                    component.stop()
-            except Exception as e:
-                self.logger.error(f"Error stopping {component.__class__.__name__}: {e}")
+        # Network clients each wait on their own socket/thread teardown; stop them side by side.
+        # Daemon threads, so a stop that hangs past the shared deadline can't block process exit
+        threads = {}
+        for stop in self._stoppables:
+            thread = threading.Thread(target=self._stop_component, args=(stop,), name="cleanup", daemon=True)
+            thread.start()
+            threads[thread] = stop
+        deadline = time.monotonic() + 5
+        for thread, stop in threads.items():
+            thread.join(max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                self.logger.warning(f"Timed out stopping {stop.__self__.__class__.__name__}")
+        
+        # Tk must be torn down from the thread that owns it
+        self._stop_component(self.gui.stop)
+
+    def _stop_component(self, stop: Callable[[], Any]):
+        """Call a component's bound stop method, logging any error it raises."""
+        try:
+            stop()
+        except Exception as e:
+            self.logger.error(f"Error stopping {stop.__self__.__class__.__name__}: {e}")
 
 def main():
     """Application entry point."""
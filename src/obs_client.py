@@ -1,645 +1,844 @@
+import asyncio
+import base64
+import hashlib
+import itertools
+import json
+import random
 import threading
-import time
-from typing import Optional, Dict, Callable, List
-from obswebsocket import obsws, requests, events
+from concurrent.futures import Future
+from functools import partial
+from typing import Optional, Dict, DefaultDict, Callable, List, Tuple, Awaitable
+from collections import defaultdict
+import websockets
 from logger import Logger
 
+# obs-websocket v5 message opcodes
+_OP_HELLO = 0
+_OP_IDENTIFY = 1
+_OP_IDENTIFIED = 2
+_OP_EVENT = 5
+_OP_REQUEST = 6
+_OP_REQUEST_RESPONSE = 7
+_OP_REQUEST_BATCH = 8
+_OP_REQUEST_BATCH_RESPONSE = 9
+_RPC_VERSION = 1
+
+# Seconds to wait for the handshake or a request response
+_REQUEST_TIMEOUT = 10.0
+
+# WebSocket keepalive; a missed pong closes the connection and wakes the client loop
+_PING_INTERVAL = 5.0
+_PING_TIMEOUT = 2.0
+
+# Reconnect backoff bounds in seconds; the delay doubles per failed attempt
+_RECONNECT_MIN_DELAY = 0.1
+_RECONNECT_MAX_DELAY = 30.0
+
+def _auth_hash(text: str) -> str:
+    """Base64-encoded SHA-256 digest, as used by the obs-websocket authentication scheme."""
+    return base64.b64encode(hashlib.sha256(text.encode()).digest()).decode()
+
 class OBSClient:
     """
     OBS WebSocket client that handles connections and events.
-    
+
+    All socket I/O runs on one asyncio event loop in a dedicated thread. The public
+    methods are a thin synchronous adapter over it: each schedules a coroutine on
+    the loop and hands its result to the optional callback, so several requests
+    can be outstanding on the socket at once.
+
     Attributes:
         logger (Logger): Logger instance
         host (str): OBS WebSocket host
         port (int): OBS WebSocket port
         password (str): OBS WebSocket password
+        connected (bool): Whether the WebSocket connection is established
+        recording (bool): Whether OBS is currently recording
+        profiles (List[str]): Available OBS profiles
     """
-    
-    def __init__(self, host: str = "localhost", port: int = 4455, password: str = ""):
-        self.logger = Logger()
+
+    def __init__(self, host: str = "localhost", port: int = 4455, password: str = "",
+                 logger: Optional[Logger] = None):
+        self.logger = logger or Logger()
         self.host = host
         self.port = port
         self.password = password
-        
-        self._ws: Optional[obsws] = None
-        self._running = False
-        self._connected = False
-        self._profiles: List[str] = []
-        self._recording = False
-        
-        # Locks for thread safety
-        self._connection_lock = threading.Lock()
-        self._operation_lock = threading.Lock()
-        
+
+        self._ws: Optional[websockets.ClientConnection] = None
+        self._running = False  # Whether the client loop keeps reconnecting
+        # Plain attributes, read directly by callers on every connection check
+        self.connected = False
+        self.profiles: List[str] = []
+        self.recording = False
+
+        # Event loop thread, created on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._client_future: Optional[Future] = None  # Reconnect loop started by start()
+        self._wake: Optional[asyncio.Event] = None  # Wakes the reconnect loop early
+        self._connect_task: Optional[asyncio.Task] = None  # Connection attempt in progress
+        self._reader_task: Optional[asyncio.Task] = None
+
+        # Requests sent to OBS and awaiting a response, keyed by request id
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._request_ids = itertools.count(1)
+
         # Event handlers
-        self._event_handlers: Dict[str, List[Callable]] = {}
-        
-        # Background thread
-        self._bg_thread = None
+        self._event_handlers: DefaultDict[str, List[Callable]] = defaultdict(list)
+        # Immutable snapshot of the recording handlers, rebuilt on registration
+        self._record_state_handlers: Tuple[Callable, ...] = ()
+        self._obs_event_handlers: Dict[str, Callable[[dict], None]] = {
+            'RecordStateChanged': self._on_recording_state_changed,
+            'ProfileListChanged': self._on_profiles_changed,
+            'CurrentProfileChanged': self._on_profiles_changed,
+            'SceneListChanged': self._on_scenes_changed,
+            'CurrentProgramSceneChanged': self._on_current_scene_changed,
+        }
+
+        # Query results reused until an OBS event says they changed; the version
+        # counter stops a fetch that raced with an invalidation from being cached
+        self._profiles_cache: Optional[List[str]] = None
+        self._scenes_cache: Optional[List[str]] = None
+        self._current_scene_cache: Optional[str] = None
+        self._cache_version = 0
+
+        # Queries already sent to OBS, shared by every caller asking for the same one
+        self._inflight: Dict[str, asyncio.Task] = {}
 
-        self._connection_callbacks: List[Callable[[bool], None]] = []
         self._connection_handlers: List[Callable[[bool], None]] = []  # Changed to handle connection state
-        self._disconnection_handlers: List[Callable] = []
-
-    @property
-    def connected(self) -> bool:
-        """Get connection state."""
-        return self._connected
 
-    def _on_recording_state_changed(self, event):
+    def _on_recording_state_changed(self, data: dict):
         """Handle recording state change events"""
         try:
-            # OBS WebSocket v5 uses 'outputActive' in datain
-            if hasattr(event, 'datain'):
-                self._recording = event.datain.get('outputActive', False)
-                self.logger.debug(f"Recording state changed to: {self._recording}")
-                # Trigger any registered callbacks
-                if 'RecordStateChanged' in self._event_handlers:
-                    for callback in self._event_handlers['RecordStateChanged']:
-                        try:
-                            callback(self._recording)
-                        except Exception as e:
-                            self.logger.error(f"Error in recording state callback: {str(e)}")
+            # OBS WebSocket v5 uses 'outputActive' in eventData
+            self.recording = data.get('outputActive', False)
+            self.logger.debug("Recording state changed to: %s", self.recording)
+            # Trigger any registered callbacks
+            for callback in self._record_state_handlers:
+                try:
+                    callback(self.recording)
+                except Exception as e:
+                    self.logger.error("Error in recording state callback: %s", e)
+        except Exception as e:
+            self.logger.error("Error handling recording state change: %s", e)
+            self.recording = False
+
+    def _on_profiles_changed(self, data: dict):
+        """Drop cached profiles when OBS reports a profile change"""
+        self._cache_version += 1
+        self._profiles_cache = None
+
+    def _on_scenes_changed(self, data: dict):
+        """Drop cached scenes when OBS reports a scene list change"""
+        self._cache_version += 1
+        self._scenes_cache = None
+
+    def _on_current_scene_changed(self, data: dict):
+        """Drop the cached current scene when OBS switches scenes"""
+        self._cache_version += 1
+        self._current_scene_cache = None
+
+    def _invalidate_caches(self):
+        """Drop every cached query result"""
+        self._cache_version += 1
+        self._profiles_cache = None
+        self._scenes_cache = None
+        self._current_scene_cache = None
+
+    # Event loop
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop thread on first use and return its loop."""
+        if self._loop is None:
+            loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self._run_loop, args=(loop,),
+                                                 name="obs-ws", daemon=True)
+            self._loop = loop
+            self._loop_thread.start()
+        return self._loop
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop):
+        """Run the client event loop until stop(), then cancel whatever is left on it."""
+        asyncio.set_event_loop(loop)
+        # Created on the loop thread; nothing scheduled on the loop runs before this
+        self._wake = asyncio.Event()
+        try:
+            loop.run_forever()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        finally:
+            loop.close()
+        self.logger.debug("OBS WebSocket client thread ending")
+
+    def _submit(self, coro: Awaitable, callback: Optional[Callable] = None) -> Future:
+        """Schedule a coroutine on the client loop, handing its result to callback."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        if callback:
+            future.add_done_callback(partial(self._deliver, callback))
+        return future
+
+    def _deliver(self, callback: Callable, future: Future):
+        """Pass a finished coroutine's result to its callback"""
+        if future.cancelled():
+            return
+        try:
+            callback(future.result())
         except Exception as e:
-            self.logger.error(f"Error handling recording state change: {str(e)}")
-            self._recording = False
+            self.logger.error("Error in OBS callback: %s", e)
+
+    # Protocol
+    async def _identify(self, ws):
+        """Complete the obs-websocket Hello/Identify handshake, authenticating if required."""
+        hello = json.loads(await asyncio.wait_for(ws.recv(), _REQUEST_TIMEOUT))
+        if hello.get('op') != _OP_HELLO:
+            raise ConnectionError("Unexpected handshake message from OBS")
+
+        identify = {'rpcVersion': _RPC_VERSION}
+        auth = hello.get('d', {}).get('authentication')
+        if auth:
+            secret = _auth_hash(self.password + auth['salt'])
+            identify['authentication'] = _auth_hash(secret + auth['challenge'])
+        await ws.send(json.dumps({'op': _OP_IDENTIFY, 'd': identify}))
+
+        identified = json.loads(await asyncio.wait_for(ws.recv(), _REQUEST_TIMEOUT))
+        if identified.get('op') != _OP_IDENTIFIED:
+            raise ConnectionError("OBS did not accept the identification")
+
+    async def _request(self, request_type: str, data: Optional[dict] = None) -> dict:
+        """
+        Send a request to OBS and wait for its response.
 
-    def _connect(self):
-        """Establish connection to OBS WebSocket"""
-        with self._connection_lock:
-            try:
-                self.logger.info(f"Connecting to OBS WebSocket at {self.host}:{self.port}...")
-                self._ws = obsws(self.host, self.port, self.password)
-                self._ws.register(self._on_recording_state_changed, events.RecordStateChanged)
-                
-                # Connect and verify connection
-                self._ws.connect()
-                response = self._ws.call(requests.GetVersion())
-                
-                if response:
-                    self._connected = True
-                    self._update_profiles()
-                    return True
-                    
-                raise ConnectionError("No response from OBS")
-                    
-            except Exception as e:
-                self.logger.error(f"Connection failed: {str(e)}")
-                self._connected = False
-                if self._ws:
-                    self._ws.disconnect()
-                return False
-
-    def _update_profiles(self):
-        """Get available profiles from OBS"""
-        with self._operation_lock:
-            try:
-                response = self._ws.call(requests.GetProfileList())
-                if hasattr(response, 'datain') and 'profiles' in response.datain:
-                    self._profiles = response.datain['profiles']
-                    self.logger.debug(f"Retrieved profiles: {self._profiles}")
-                else:
-                    self.logger.error("Unexpected response format from GetProfileList")
-                    self._profiles = []
-            except Exception as e:
-                self.logger.error(f"Failed to get profiles: {str(e)}")
-                self._profiles = []
+        Requests are matched to responses by id, so any number can be outstanding.
 
-    def get_profiles(self) -> List[str]:
-        """Get available OBS profiles and update internal list"""
-        if not self._connected:
-            self.logger.error("Not connected to OBS")
-            return []
-            
+        Returns:
+            dict: The response data, empty if OBS sent none
+
+        Raises:
+            ConnectionError: If not connected to OBS
+            RuntimeError: If OBS reports that the request failed
+        """
+        ws = self._ws
+        if ws is None:
+            raise ConnectionError("Not connected to OBS")
+
+        request_id = str(next(self._request_ids))
+        payload = {'requestType': request_type, 'requestId': request_id}
+        if data:
+            payload['requestData'] = data
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await ws.send(json.dumps({'op': _OP_REQUEST, 'd': payload}))
+            response = await asyncio.wait_for(future, _REQUEST_TIMEOUT)
+        finally:
+            self._pending.pop(request_id, None)
+
+        status = response.get('requestStatus', {})
+        if not status.get('result', False):
+            raise RuntimeError(f"{request_type} failed: {status.get('comment') or status.get('code')}")
+        return response.get('responseData') or {}
+
+    async def _request_batch(self, *request_types: str) -> List[Optional[dict]]:
+        """
+        Send several requests to OBS in one message and wait for all their responses.
+
+        Args:
+            *request_types: The request types to send, run by OBS in order
+
+        Returns:
+            List[Optional[dict]]: The response data for each request in order,
+                None for each request OBS reports as failed
+
+        Raises:
+            ConnectionError: If not connected to OBS
+        """
+        ws = self._ws
+        if ws is None:
+            raise ConnectionError("Not connected to OBS")
+
+        request_id = str(next(self._request_ids))
+        payload = {
+            'requestId': request_id,
+            'requests': [{'requestType': request_type} for request_type in request_types]
+        }
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await ws.send(json.dumps({'op': _OP_REQUEST_BATCH, 'd': payload}))
+            response = await asyncio.wait_for(future, _REQUEST_TIMEOUT)
+        finally:
+            self._pending.pop(request_id, None)
+
+        results = response.get('results') or []
+        data = []
+        for request_type, result in zip(request_types, results):
+            status = result.get('requestStatus', {})
+            if status.get('result', False):
+                data.append(result.get('responseData') or {})
+            else:
+                self.logger.error("%s failed: %s", request_type, status.get('comment') or status.get('code'))
+                data.append(None)
+        # OBS stops a batch early only when told to halt on failure, but pad regardless
+        data.extend([None] * (len(request_types) - len(data)))
+        return data
+
+    async def _read_messages(self, ws):
+        """Route responses to their pending requests and events to their handlers until the socket closes."""
         try:
-            self._update_profiles()
-            return self._profiles
+            async for message in ws:
+                try:
+                    msg = json.loads(message)
+                except json.JSONDecodeError:
+                    self.logger.warning("Received invalid JSON message: %s", message)
+                    continue
+
+                op = msg.get('op')
+                d = msg.get('d') or {}
+                if op in (_OP_REQUEST_RESPONSE, _OP_REQUEST_BATCH_RESPONSE):
+                    future = self._pending.get(d.get('requestId'))
+                    if future is not None and not future.done():
+                        future.set_result(d)
+                elif op == _OP_EVENT:
+                    handler = self._obs_event_handlers.get(d.get('eventType'))
+                    if handler is not None:
+                        handler(d.get('eventData') or {})
+        except websockets.exceptions.ConnectionClosed:
+            self.logger.warning("OBS WebSocket connection closed")
         except Exception as e:
-            self.logger.error(f"Failed to get profiles: {str(e)}")
-            return []
+            self.logger.error("WebSocket error: %s", e)
+        finally:
+            if self._ws is ws:
+                self._connection_lost()
+
+    def _connection_lost(self):
+        """Reset state after the socket closed without disconnect() being asked for."""
+        self._ws = None
+        self._fail_pending()
+        self._invalidate_caches()
+        if self.connected:
+            self.connected = False
+            self._notify_connection_state(False)
+        self._wake.set()
+
+    def _fail_pending(self):
+        """Fail every request still waiting for a response"""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("OBS connection closed"))
+
+    async def _close(self):
+        """Close the socket without notifying handlers"""
+        ws, self._ws = self._ws, None
+        self.connected = False
+        self._fail_pending()
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception as e:
+                self.logger.error("Error during WebSocket disconnect: %s", e)
 
-    def _run_client(self):
-        """Main client loop running in separate thread"""
+    # Connection management
+    async def _run_client(self):
+        """
+        Keep the client connected until stopped.
+
+        Sleeps on _wake instead of polling. While disconnected, connect attempts back
+        off exponentially with jitter, starting at 100ms and capped at 30 seconds, like
+        the LCU client. While connected, it waits until the reader reports the
+        connection lost, and the delay starts over. The WebSocket's own ping frames
+        detect dead connections, so no liveness requests are sent.
+        """
+        delay = _RECONNECT_MIN_DELAY
         while self._running:
+            self._wake.clear()
+            if not self.connected and await self._async_connect():
+                delay = _RECONNECT_MIN_DELAY
+
+            if self.connected:
+                await self._wake.wait()
+                continue
+
+            # Wait the current delay first, then double it for the next attempt
+            wait = delay + random.random() * 0.3 * delay
+            self.logger.info("Attempting to reconnect in %.1f seconds...", wait)
             try:
-                if not self._connected:
-                    success = self._connect()
-                    if success:
-                        self._update_profiles()
-                time.sleep(1)
-            except Exception as e:
-                self.logger.error(f"WebSocket error: {str(e)}")
-                if self._running:
-                    self.logger.info("Attempting to reconnect...")
-                    time.sleep(1)
-            finally:
-                if self._ws and not self._running:
-                    self._ws.disconnect()
-                    self._connected = False
+                await asyncio.wait_for(self._wake.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, _RECONNECT_MAX_DELAY)
+
+    async def _async_connect(self) -> bool:
+        """Connect to OBS, joining an attempt that is already in progress."""
+        if self.connected:
+            return True
+        if self._connect_task is None or self._connect_task.done():
+            self._connect_task = asyncio.ensure_future(self._open())
+        return await asyncio.shield(self._connect_task)
 
-        self.logger.debug("OBS WebSocket client thread ending")
+    async def _open(self) -> bool:
+        """
+        Connect to OBS WebSocket, load profiles and notify connection handlers.
+
+        Returns:
+            bool: True if the connection was established
+        """
+        try:
+            self.logger.info("Connecting to OBS WebSocket at %s:%s...", self.host, self.port)
+            ws = await websockets.connect(
+                f"ws://{self.host}:{self.port}",
+                compression=None,
+                max_size=None,
+                ping_interval=_PING_INTERVAL,
+                ping_timeout=_PING_TIMEOUT
+            )
+            try:
+                await self._identify(ws)
+            except BaseException:
+                await ws.close()
+                raise
+
+            self._ws = ws
+            self._reader_task = asyncio.ensure_future(self._read_messages(ws))
+
+            # The identify handshake already proves the socket works; one batch then
+            # primes every cache so the first refresh after connecting is free
+            version = self._cache_version
+            profiles, scenes, current_scene = await self._request_batch(
+                'GetProfileList', 'GetSceneList', 'GetCurrentProgramScene'
+            )
+            if profiles is None:
+                raise RuntimeError("Could not retrieve profiles")
+            self._store_profiles(profiles, version)
+            if scenes is not None:
+                self._store_scene_list(scenes, version)
+            if current_scene is not None:
+                self._store_current_scene(current_scene, version)
+
+            self.connected = True
+            self._notify_connection_state(True)
+            return True
+
+        except Exception as e:
+            self.logger.error("Connection failed: %s", e)
+            await self._close()
+            return False
+
+    async def _async_disconnect(self) -> bool:
+        """Stop reconnecting, close the socket and notify connection handlers."""
+        try:
+            self.logger.info("Disconnecting from OBS...")
+            self._running = False
+            self._wake.set()
+
+            # Reset state before the close suspends, so a connect() queued behind
+            # this can't have its connection reported before our disconnection
+            self.profiles = []
+            self._invalidate_caches()
+            self.recording = False
+            self._notify_connection_state(False)  # Changed to use new notification
+            await self._close()
+            return True
+        except Exception as e:
+            self.logger.error("Failed to disconnect: %s", e)
+            return False
 
     # Public API
     def start(self) -> bool:
         """Start the OBS WebSocket client"""
         if self._running:
             return False
-            
-        self._running = True
-        success = self.connect(callback=self._on_connect_complete)
-        return success
-
-    def _on_connect_complete(self, success: bool):
-        """Handle connection completion"""
-        if success:
-            # Start background thread for keepalive
-            self._bg_thread = threading.Thread(target=self._keepalive_loop)
-            self._bg_thread.daemon = True
-            self._bg_thread.start()
-        else:
-            self._running = False
 
-    def _keepalive_loop(self):
-        """Background thread for keepalive"""
-        while self._running and self._connected:
-            try:
-                with self._operation_lock:
-                    self._ws.call(requests.GetVersion())
-                time.sleep(5)
-            except Exception:
-                break
-                
-        self._connected = False
+        self._running = True
+        # One task connects, reconnects with backoff and waits out the connection
+        self._client_future = self._submit(self._run_client())
+        return True
 
     def stop(self) -> bool:
         """Stop the OBS WebSocket client"""
-        if not self._running:
+        if self._loop is None:
             return True
-            
+
         try:
             self.logger.info("Stopping OBS WebSocket client...")
             self._running = False
-            
-            # Handle WebSocket disconnect
-            if self._ws:
-                try:
-                    self._ws.disconnect()
-                except Exception as e:
-                    self.logger.error(f"Error disconnecting WebSocket: {str(e)}")
-            
+            loop = self._loop
+
+            # Close the socket on the loop, then stop the loop itself
+            try:
+                asyncio.run_coroutine_threadsafe(self._close(), loop).result(timeout=2)
+            except Exception as e:
+                self.logger.error("Error disconnecting WebSocket: %s", e)
+            loop.call_soon_threadsafe(loop.stop)
+
             # Handle thread cleanup
-            if self._bg_thread and self._bg_thread.is_alive():
+            if self._loop_thread and self._loop_thread.is_alive():
                 try:
-                    self._bg_thread.join(timeout=1)
+                    self._loop_thread.join(timeout=1)
                 except Exception as e:
-                    self.logger.error(f"Error joining thread: {str(e)}")
-            
-            self._connected = False
-            self._ws = None
-            self._bg_thread = None
+                    self.logger.error("Error joining thread: %s", e)
+
+            self.connected = False
+            self._loop = None
+            self._loop_thread = None
+            self._client_future = None
+            self._connect_task = None
+            self._reader_task = None
+            self._inflight.clear()
             self.logger.info("OBS WebSocket client stopped")
             return True
-            
+
         except Exception as e:
-            self.logger.error(f"Error stopping client: {str(e)}")
+            self.logger.error("Error stopping client: %s", e)
             return False
 
+    def connect(self, callback: Optional[Callable[[bool], None]] = None) -> bool:
+        """Connect to OBS WebSocket with callback"""
+        if self.connected:
+            if callback:
+                callback(True)
+            return True
+
+        self._submit(self._async_connect(), callback)
+        return True
+
+    def disconnect(self, callback: Optional[Callable[[bool], None]] = None) -> bool:
+        """Disconnect from OBS with callback"""
+        if not self.connected:
+            if callback:
+                callback(True)
+            return True
+
+        # Mark disconnected right away so a connect() queued behind this starts fresh
+        self.connected = False
+        self._submit(self._async_disconnect(), callback)
+        return True
+
+    def update_settings(self, host: str, port: int, password: str):
+        """Update connection settings."""
+        self.host = host
+        self.port = port
+        self.password = password
+
+        # If already connected, reconnect with new settings
+        if self.connected:
+            self.disconnect()
+            self.connect()
+
     def set_profile(self, profile_name: str, callback: Optional[Callable[[bool], None]] = None) -> bool:
         """Set OBS profile with optional callback"""
-        if not self._connected:
+        if not self.connected:
             self.logger.error("Not connected to OBS")
             if callback:
                 callback(False)
             return False
-            
-        def _set_profile():
-            try:
-                with self._operation_lock:
-                    # First verify profile exists
-                    if profile_name not in self._profiles:
-                        self.logger.error(f"Profile '{profile_name}' not found")
-                        if callback:
-                            callback(False)
-                        return False
-                    
-                    # For OBS WebSocket v5, call with parameters directly
-                    try:
-                        # Create request with proper parameters
-                        response = self._ws.call(requests.SetCurrentProfile(**{
-                            'profile-name': profile_name
-                        }))
-                        
-                        # In v5, no response means success
-                        success = True
-                        
-                        if success:
-                            self.logger.info(f"Changed profile to: {profile_name}")
-                        else:
-                            self.logger.error(f"Failed to change profile - unexpected response")
-                            
-                        if callback:
-                            callback(success)
-                        return success
-                            
-                    except obsws.exceptions.OBSWebSocketError as e:
-                        self.logger.error(f"OBS WebSocket error: {str(e)}")
-                        if callback:
-                            callback(False)
-                        return False
-                        
-            except Exception as e:
-                self.logger.error(f"Failed to set profile: {str(e)}")
-                if callback:
-                    callback(False)
-                return False
-        
-        thread = threading.Thread(target=_set_profile)
-        thread.daemon = True
-        thread.start()
+
+        self._submit(self._async_set_profile(profile_name), callback)
         return True
 
+    async def _async_set_profile(self, profile_name: str) -> bool:
+        """Set the OBS profile"""
+        # First verify profile exists
+        if profile_name not in self.profiles:
+            self.logger.error("Profile '%s' not found", profile_name)
+            return False
+
+        try:
+            await self._request('SetCurrentProfile', {'profileName': profile_name})
+            self.logger.info("Changed profile to: %s", profile_name)
+            return True
+        except Exception as e:
+            self.logger.error("Failed to set profile: %s", e)
+            return False
+
     def start_recording(self, callback: Optional[Callable[[bool], None]] = None) -> bool:
         """Start recording with optional callback"""
-        if not self._connected:
+        if not self.connected:
             self.logger.error("Not connected to OBS")
             if callback:
                 callback(False)
             return False
-            
-        def _start_recording():
-            try:
-                with self._operation_lock:
-                    response = self._ws.call(requests.StartRecord())
-                    success = hasattr(response, 'status') and response.status
-                    if success:
-                        self._recording = True
-                        self.logger.info("Started recording")
-                    if callback:
-                        callback(success)
-                    return success
-            except Exception as e:
-                self.logger.error(f"Failed to start recording: {str(e)}")
-                if callback:
-                    callback(False)
-                return False
-        
-        thread = threading.Thread(target=_start_recording)
-        thread.daemon = True
-        thread.start()
+
+        self._submit(self._async_start_recording(), callback)
         return True
 
+    async def _async_start_recording(self) -> bool:
+        """Start recording"""
+        try:
+            await self._request('StartRecord')
+            self.recording = True
+            self.logger.info("Started recording")
+            return True
+        except Exception as e:
+            self.logger.error("Failed to start recording: %s", e)
+            return False
+
     def stop_recording(self, callback: Optional[Callable[[bool], None]] = None) -> bool:
         """Stop recording with optional callback"""
-        if not self._connected:
+        if not self.connected:
             self.logger.error("Not connected to OBS")
             if callback:
                 callback(False)
             return False
-            
-        def _stop_recording():
-            try:
-                with self._operation_lock:
-                    response = self._ws.call(requests.StopRecord())
-                    success = hasattr(response, 'status') and response.status
-                    if success:
-                        self._recording = False
-                        self.logger.info("Stopped recording")
-                    if callback:
-                        callback(success)
-                    return success
-            except Exception as e:
-                self.logger.error(f"Failed to stop recording: {str(e)}")
-                if callback:
-                    callback(False)
-                return False
-        
-        thread = threading.Thread(target=_stop_recording)
-        thread.daemon = True
-        thread.start()
-        return True
 
-    def register_event_handler(self, event_type: str, callback: Callable):
-        """Register a callback for specific events"""
-        if event_type not in self._event_handlers:
-            self._event_handlers[event_type] = []
-        self._event_handlers[event_type].append(callback)
+        self._submit(self._async_stop_recording(), callback)
+        return True
 
-    def connect(self, callback: Optional[Callable[[bool], None]] = None) -> bool:
-        """Connect to OBS WebSocket with callback"""
-        if self._connected:
-            if callback:
-                callback(True)
+    async def _async_stop_recording(self) -> bool:
+        """Stop recording"""
+        try:
+            await self._request('StopRecord')
+            self.recording = False
+            self.logger.info("Stopped recording")
             return True
+        except Exception as e:
+            self.logger.error("Failed to stop recording: %s", e)
+            return False
 
-        def _connect_thread():
-            try:
-                with self._connection_lock:
-                    self.logger.info(f"Connecting to OBS WebSocket at {self.host}:{self.port}...")
-                    self._ws = obsws(self.host, self.port, self.password)
-                    self._ws.register(self._on_recording_state_changed, events.RecordStateChanged)
-                    
-                    # Connect and verify connection
-                    self._ws.connect()
-                    response = self._ws.call(requests.GetVersion())
-                    
-                    if response:
-                        self._connected = True
-                        self._update_profiles()
-                        self._notify_connection_state(True)  # Changed to use new notification
-                        if callback:
-                            callback(True)
-                        return True
-                        
-                    raise ConnectionError("No response from OBS")
-                        
-            except Exception as e:
-                self.logger.error(f"Connection failed: {str(e)}")
-                self._connected = False
-                if self._ws:
-                    self._ws.disconnect()
-                if callback:
-                    callback(False)
-                return False
-
-        thread = threading.Thread(target=_connect_thread)
-        thread.daemon = True
-        thread.start()
-        return True
+    def register_event_handler(self, event_type: str, callback: Callable):
+        """Register a callback for specific events"""
+        handlers = self._event_handlers[event_type]
+        handlers.append(callback)
+        # Dispatch reads the tuple directly; registering mid-dispatch swaps in a new one
+        if event_type == 'RecordStateChanged':
+            self._record_state_handlers = tuple(handlers)
 
     def get_profiles(self, callback: Optional[Callable[[List[str]], None]] = None) -> bool:
         """Get available OBS profiles with callback"""
-        if not self._connected:
+        if not self.connected:
             self.logger.error("Not connected to OBS")
             if callback:
                 callback([])
             return False
-                
-        def _get_profiles_thread():
-            try:
-                with self._operation_lock:
-                    response = self._ws.call(requests.GetProfileList())
-                    if hasattr(response, 'datain'):
-                        self._profiles = response.datain.get('profiles', [])
-                        self.logger.debug(f"Retrieved profiles: {self._profiles}")
-                        if callback:
-                            callback(self._profiles)
-                    else:
-                        self.logger.error("Unexpected response format from GetProfileList")
-                        if callback:
-                            callback([])
-            except Exception as e:
-                self.logger.error(f"Failed to get profiles: {str(e)}")
-                if callback:
-                    callback([])
 
-        thread = threading.Thread(target=_get_profiles_thread)
-        thread.daemon = True
-        thread.start()
+        self._submit(self._async_get_profiles(), callback)
         return True
 
-    def disconnect(self, callback: Optional[Callable[[bool], None]] = None) -> bool:
-        """Disconnect from OBS with callback"""
-        if not self._connected:
-            if callback:
-                callback(True)
-            return True
-
-        def _disconnect_thread():
-            try:
-                with self._connection_lock:
-                    self.logger.info("Disconnecting from OBS...")
-                    self._running = False
-                    
-                    # Stop keepalive thread first
-                    if self._bg_thread and self._bg_thread.is_alive():
-                        self._bg_thread.join(timeout=2)
-                    self._bg_thread = None
-                    
-                    # Disconnect WebSocket
-                    if self._ws:
-                        try:
-                            self._ws.disconnect()
-                        except Exception as e:
-                            self.logger.error(f"Error during WebSocket disconnect: {str(e)}")
-                    
-                    self._ws = None
-                    self._connected = False
-                    self._profiles = []
-                    self._recording = False
-                    self._notify_connection_state(False)  # Changed to use new notification
-                    if callback:
-                        callback(True)
-                    return True
+    async def _async_get_profiles(self) -> List[str]:
+        """Get OBS profiles from the cache, or from OBS if they changed"""
+        # Callers get their own copy, so mutating it can't touch the cache
+        profiles = self._profiles_cache
+        if profiles is None:
+            profiles = await self._coalesced('profiles', self._fetch_profiles)
+        return list(profiles)
 
-            except Exception as e:
-                self.logger.error(f"Failed to disconnect: {str(e)}")
-                if callback:
-                    callback(False)
-                return False
-
-        thread = threading.Thread(target=_disconnect_thread)
-        thread.daemon = True
-        thread.start()
-        return True
-
-    def update_settings(self, host: str, port: int, password: str):
-        """Update connection settings."""
-        self.host = host
-        self.port = port
-        self.password = password
-        
-        # If already connected, reconnect with new settings
-        if self.is_connected:
-            self.disconnect()
-            self.connect()
+    async def _fetch_profiles(self) -> List[str]:
+        """Fetch OBS profiles"""
+        try:
+            version = self._cache_version
+            return self._store_profiles(await self._request('GetProfileList'), version)
+        except Exception as e:
+            self.logger.error("Failed to get profiles: %s", e)
+            return []
 
-    @property
-    def profiles(self) -> List[str]:
-        """Get available OBS profiles"""
-        return self._profiles
-
-    @property
-    def is_recording(self) -> bool:
-        """Get current recording state"""
-        return self._recording
-
-    @property
-    def is_connected(self) -> bool:
-        """Get connection state"""
-        return self._connected
-
-    def add_connection_callback(self, callback: Callable[[bool], None]):
-        """Add a callback to be notified of connection state changes."""
-        if callback not in self._connection_callbacks:
-            self._connection_callbacks.append(callback)
-
-    def _notify_connection_callbacks(self, connected: bool):
-        """Notify all registered callbacks of connection state changes."""
-        for callback in self._connection_callbacks:
-            try:
-                callback(connected)
-            except Exception as e:
-                self.logger.error(f"Error in connection callback: {str(e)}")
+    def _store_profiles(self, data: dict, version: int) -> List[str]:
+        """Read profiles from a GetProfileList response, caching them if nothing changed since version"""
+        self.profiles = data.get('profiles', [])
+        if version == self._cache_version:
+            self._profiles_cache = list(self.profiles)
+        self.logger.debug("Retrieved profiles: %s", self.profiles)
+        return self.profiles
 
     def get_scene_list(self, callback: Optional[Callable[[List[str]], None]] = None) -> bool:
         """
         Get available OBS scenes with callback.
-        
+
         Args:
             callback: Optional callback function that receives the list of scene names
-            
+
         Returns:
             bool: True if the request was initiated successfully, False otherwise
         """
-        if not self._connected:
+        if not self.connected:
             self.logger.error("Not connected to OBS")
             if callback:
                 callback([])
             return False
-                
-        def _get_scenes_thread():
-            try:
-                with self._operation_lock:
-                    response = self._ws.call(requests.GetSceneList())
-                    scenes = []
-                    
-                    # For OBS WebSocket v5
-                    if hasattr(response, 'datain') and isinstance(response.datain, dict):
-                        scene_list = response.datain.get('scenes', [])
-                        if isinstance(scene_list, list):
-                            scenes = [scene.get('sceneName', '') for scene in scene_list if scene.get('sceneName')]
-                    
-                    self.logger.debug(f"Retrieved scenes: {scenes}")
-                    if callback:
-                        callback(scenes)
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to get scenes: {str(e)}")
-                if callback:
-                    callback([])
 
-        thread = threading.Thread(target=_get_scenes_thread)
-        thread.daemon = True
-        thread.start()
+        self._submit(self._async_get_scene_list(), callback)
         return True
 
+    async def _async_get_scene_list(self) -> List[str]:
+        """Get OBS scenes from the cache, or from OBS if they changed"""
+        # Callers get their own copy, so mutating it can't touch the cache
+        scenes = self._scenes_cache
+        if scenes is None:
+            scenes = await self._coalesced('scenes', self._fetch_scene_list)
+        return list(scenes)
+
+    async def _fetch_scene_list(self) -> List[str]:
+        """Fetch OBS scenes"""
+        try:
+            version = self._cache_version
+            return self._store_scene_list(await self._request('GetSceneList'), version)
+        except Exception as e:
+            self.logger.error("Failed to get scenes: %s", e)
+            return []
+
+    def _store_scene_list(self, data: dict, version: int) -> List[str]:
+        """Read scene names from a GetSceneList response, caching them if nothing changed since version"""
+        scenes = [name for scene in data.get('scenes', ()) if (name := scene.get('sceneName'))]
+        if version == self._cache_version:
+            self._scenes_cache = scenes
+        self.logger.debug("Retrieved scenes: %s", scenes)
+        return scenes
+
     def set_current_scene(self, scene_name: str, callback: Optional[Callable[[bool], None]] = None) -> bool:
         """
         Set current OBS scene with callback.
-        
+
         Args:
             scene_name: Name of the scene to switch to
             callback: Optional callback function that receives success status
-            
+
         Returns:
             bool: True if the request was initiated successfully, False otherwise
         """
-        if not self._connected:
+        if not self.connected:
             self.logger.error("Not connected to OBS")
             if callback:
                 callback(False)
             return False
-                
-        def _set_scene_thread():
-            try:
-                with self._operation_lock:
-                    # For OBS WebSocket v5
-                    response = self._ws.call(requests.SetCurrentProgramScene(**{
-                        'sceneName': scene_name  # Changed from 'scene-name' to 'sceneName'
-                    }))
-                    
-                    # In v5, no error response means success
-                    success = True
-                    
-                    if success:
-                        self.logger.info(f"Changed scene to: {scene_name}")
-                        # Notify any registered callbacks about scene change
-                        if 'SceneChanged' in self._event_handlers:
-                            for handler in self._event_handlers['SceneChanged']:
-                                try:
-                                    handler(scene_name)
-                                except Exception as e:
-                                    self.logger.error(f"Error in scene change handler: {str(e)}")
-                    else:
-                        self.logger.error("Failed to change scene - unexpected response")
-                        
-                    if callback:
-                        callback(success)
-                    return success
-                        
-            except Exception as e:
-                self.logger.error(f"Failed to set scene: {str(e)}")
-                if callback:
-                    callback(False)
-                return False
-
-        thread = threading.Thread(target=_set_scene_thread)
-        thread.daemon = True
-        thread.start()
+
+        self._submit(self._async_set_current_scene(scene_name), callback)
+        return True
+
+    async def _async_set_current_scene(self, scene_name: str) -> bool:
+        """Switch the OBS scene"""
+        try:
+            await self._request('SetCurrentProgramScene', {'sceneName': scene_name})
+        except Exception as e:
+            self.logger.error("Failed to set scene: %s", e)
+            return False
+
+        self.logger.info("Changed scene to: %s", scene_name)
         return True
 
     def get_current_scene(self, callback: Optional[Callable[[str], None]] = None) -> bool:
         """
         Get current OBS scene with callback.
-        
+
         Args:
             callback: Optional callback function that receives the current scene name
-            
+
         Returns:
             bool: True if the request was initiated successfully, False otherwise
         """
-        if not self._connected:
+        if not self.connected:
             self.logger.error("Not connected to OBS")
             if callback:
                 callback("")
             return False
-                
-        def _get_current_scene_thread():
+
+        self._submit(self._async_get_current_scene(), callback)
+        return True
+
+    async def _async_get_current_scene(self) -> str:
+        """Get the current OBS scene from the cache, or from OBS if it changed"""
+        if self._current_scene_cache is not None:
+            return self._current_scene_cache
+        return await self._coalesced('current_scene', self._fetch_current_scene)
+
+    async def _fetch_current_scene(self) -> str:
+        """Fetch the current OBS scene"""
+        try:
+            version = self._cache_version
+            return self._store_current_scene(await self._request('GetCurrentProgramScene'), version)
+        except Exception as e:
+            self.logger.error("Failed to get current scene: %s", e)
+            return ""
+
+    def _store_current_scene(self, data: dict, version: int) -> str:
+        """Read the scene name from a GetCurrentProgramScene response, caching it if nothing changed since version"""
+        scene_name = data.get('currentProgramSceneName', '')
+        if version == self._cache_version:
+            self._current_scene_cache = scene_name
+        self.logger.debug("Current scene: %s", scene_name)
+        return scene_name
+
+    def refresh_all(self, callback: Callable[[List[str], List[str], str], None]) -> bool:
+        """
+        Get profiles, scenes and the current scene together.
+
+        Cached results are reused; only the missing ones are requested from OBS,
+        sent together as a single request batch.
+
+        Args:
+            callback: Callback function that receives (profiles, scenes, current_scene)
+
+        Returns:
+            bool: True if the request was initiated successfully, False otherwise
+        """
+        if not self.connected:
+            self.logger.error("Not connected to OBS")
+            callback([], [], "")
+            return False
+
+        self._submit(self._async_refresh_all(), lambda result: callback(*result))
+        return True
+
+    async def _async_refresh_all(self) -> Tuple[List[str], List[str], str]:
+        """Get every query result, fetching the missing ones in one round trip"""
+        results = [self._profiles_cache, self._scenes_cache, self._current_scene_cache]
+        queries = (
+            ('GetProfileList', self._store_profiles, []),
+            ('GetSceneList', self._store_scene_list, []),
+            ('GetCurrentProgramScene', self._store_current_scene, "")
+        )
+        missing = [i for i, result in enumerate(results) if result is None]
+
+        if missing:
+            version = self._cache_version
             try:
-                with self._operation_lock:
-                    # For OBS WebSocket v5
-                    response = self._ws.call(requests.GetCurrentProgramScene())
-                    scene_name = ""
-                    
-                    # For OBS WebSocket v5
-                    if hasattr(response, 'datain') and isinstance(response.datain, dict):
-                        scene_name = response.datain.get('currentProgramSceneName', '')
-                    
-                    self.logger.debug(f"Current scene: {scene_name}")
-                    if callback:
-                        callback(scene_name)
-                    
+                responses = await self._request_batch(*(queries[i][0] for i in missing))
             except Exception as e:
-                self.logger.error(f"Failed to get current scene: {str(e)}")
-                if callback:
-                    callback("")
+                self.logger.error("Failed to refresh OBS state: %s", e)
+                responses = [None] * len(missing)
+            for i, data in zip(missing, responses):
+                _, store, default = queries[i]
+                results[i] = default if data is None else store(data, version)
 
-        thread = threading.Thread(target=_get_current_scene_thread)
-        thread.daemon = True
-        thread.start()
-        return True
+        profiles, scenes, current_scene = results
+        # Callers get their own copies, so mutating them can't touch the caches
+        return list(profiles), list(scenes), current_scene
+
+    async def _coalesced(self, key: str, fetch: Callable[[], Awaitable]):
+        """
+        Await the query for key, sending it only if it isn't already in flight.
+
+        Every caller asking while the request is outstanding shares its result.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
 
     def add_connection_handler(self, handler: Callable[[bool], None]):
         """
         Add a handler to be called for both connection and disconnection events.
-        
+
         Args:
             handler: Callback function that receives connection state (True=connected, False=disconnected)
         """
         if handler not in self._connection_handlers:
             self._connection_handlers.append(handler)
             # Immediately notify of current state if already connected
-            if self._connected:
+            if self.connected:
                 try:
                     handler(True)
                 except Exception as e:
-                    self.logger.error(f"Error in connection handler: {str(e)}")
+                    self.logger.error("Error in connection handler: %s", e)
 
     def _notify_connection_state(self, connected: bool):
         """Notify all registered handlers of connection state change."""
-        self.logger.debug(f"Notifying connection handlers of state: {'Connected' if connected else 'Disconnected'}")
-        for handler in self._connection_handlers:
+        self.logger.debug("Notifying connection handlers of state: %s", 'Connected' if connected else 'Disconnected')
+        # Snapshot, so a handler that registers another one can't disturb the loop
+        for handler in tuple(self._connection_handlers):
             try:
                 handler(connected)
             except Exception as e:
-                self.logger.error(f"Error in connection handler: {str(e)}")
\ No newline at end of file
+                self.logger.error("Error in connection handler: %s", e)
@@ -5,7 +5,7 @@ class Theme(Enum):
     DARK = "dark"
     LIGHT = "light"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DarkThemeColors:
     # Primary colors
     primary: str = "#9103a9"  # Main purple
@@ -33,7 +33,7 @@ class DarkThemeColors:
     border: str = "#404040"           # Normal borders
     focus_border: str = "#9103a9"     # Focused borders
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LightThemeColors:
     # Primary colors
     primary: str = "#9103a9"          # Main purple
@@ -61,10 +61,8 @@ class LightThemeColors:
     border: str = "#cccccc"           # Normal borders
     focus_border: str = "#9103a9"     # Focused borders
 
-class ThemeManager:
-    _dark_theme = DarkThemeColors()
-    _light_theme = LightThemeColors()
-    
-    @classmethod
-    def get_colors(cls, theme: Theme) -> DarkThemeColors | LightThemeColors:
-        return cls._dark_theme if theme == Theme.DARK else cls._light_theme
\ No newline at end of file
+# Shared color instances per theme; look colors up with THEMES[theme]
+THEMES: dict[Theme, DarkThemeColors | LightThemeColors] = {
+    Theme.DARK: DarkThemeColors(),
+    Theme.LIGHT: LightThemeColors(),
+}
\ No newline at end of file
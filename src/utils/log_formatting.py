@@ -3,8 +3,17 @@ Logging formatters and style configurations.
 """
 
 import logging
+import sys
+import time
 from colorama import Fore, Style
-from datetime import datetime
+
+def _stream_is_tty(stream) -> bool:
+    """Whether stream is an interactive terminal; False when there is no stream (pythonw)."""
+    isatty = getattr(stream, 'isatty', None)
+    try:
+        return bool(isatty and isatty())
+    except ValueError:
+        return False  # Stream already closed
 
 class ColoredFormatter(logging.Formatter):
     """
@@ -15,6 +24,9 @@ class ColoredFormatter(logging.Formatter):
     - INFO: Green 
     - WARNING: Yellow
     - ERROR: Red
+    
+    Colors are only emitted when use_color is set; by default that is decided
+    once, from whether stdout is a terminal.
     """
     
     COLORS = {
@@ -24,22 +36,44 @@ class ColoredFormatter(logging.Formatter):
         'ERROR': Fore.RED,
     }
 
+    # Colored, padded level names, built once instead of per record
+    _LEVEL_PREFIX = {
+        level: f"{color}{level:<8}{Style.RESET_ALL} "
+        for level, color in COLORS.items()
+    }
+
+    # Padded level names without escape codes, for sinks that don't render ANSI
+    _PLAIN_PREFIX = {level: f"{level:<8} " for level in COLORS}
+
+    def __init__(self, use_color: bool = None):
+        super().__init__()
+        if use_color is None:
+            use_color = _stream_is_tty(sys.stdout)
+        self.use_color = use_color
+
     def formatTime(self, record, datefmt=None):
         """Format timestamp with milliseconds."""
-        created = datetime.fromtimestamp(record.created)
-        return created.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        return (
+            time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record.created))
+            + f".{int(record.msecs):03d}"
+        )
 
     def format(self, record):
         """Format log record with colors and proper indentation."""
-        color = self.COLORS.get(record.levelname, Fore.WHITE)
+        use_color = self.use_color
+        prefix = (self._LEVEL_PREFIX if use_color else self._PLAIN_PREFIX).get(record.levelname)
+        if prefix is None:
+            if use_color:
+                prefix = f"{Fore.WHITE}{record.levelname:<8}{Style.RESET_ALL} "
+            else:
+                prefix = f"{record.levelname:<8} "
         timestamp = self.formatTime(record)
         
-        # Indent multiline messages
-        message_lines = record.getMessage().split('\n')
-        formatted_message = '\n    '.join(message_lines)
+        # Indent multiline messages; single-line messages pass through untouched
+        message = record.getMessage()
+        if '\n' in message:
+            message = message.replace('\n', '\n    ')
         
-        return (
-            f"{Fore.WHITE}[{timestamp}] "
-            f"{color}{record.levelname:<8}{Style.RESET_ALL} "
-            f"{formatted_message}"
-        )
\ No newline at end of file
+        if use_color:
+            return f"{Fore.WHITE}[{timestamp}] {prefix}{message}"
+        return f"[{timestamp}] {prefix}{message}"
\ No newline at end of file